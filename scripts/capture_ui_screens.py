@@ -9,11 +9,18 @@ import time
 from argparse import ArgumentParser
 from collections.abc import Callable
 from collections.abc import Sequence
+from functools import cache
 from pathlib import Path
 from typing import Any
+from typing import cast
 
-import pyautogui
-from PIL import ImageGrab
+from lazi.core import lazi
+
+# pyautogui probes the display server on import, so defer it (and PIL) until a
+# capture workflow actually needs them; --help then works without a display.
+with lazi:  # type: ignore[attr-defined] # lazi has incorrectly typed code
+    import pyautogui
+    from PIL import ImageGrab
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 SRC_ROOT = REPO_ROOT / "src"
@@ -31,6 +38,10 @@ WINDOW_WIDTH = 1150
 WINDOW_HEIGHT = 900
 WINDOW_LEFT = 60
 WINDOW_TOP = 40
+PNG_COMPRESS_LEVEL = 1
+POLL_INITIAL_DELAY = 0.02
+POLL_MAX_DELAY = 0.2
+POLL_BACKOFF = 1.5
 OK = 0
 
 ENTRY_TYPES = [
@@ -53,10 +64,13 @@ RELATIVE_COORDS = {
     "faction_combo": (0.7, 0.45),
 }
 
-_automation_state = {"faction_ready": False}
+_automation_state = {"faction_ready": False, "verbose": False}
+_absolute_coords: dict[str, tuple[int, int]] = {}
+
 
-pyautogui.FAILSAFE = False
-pyautogui.PAUSE = 0.05
+def _configure_pyautogui() -> None:
+    pyautogui.FAILSAFE = False
+    pyautogui.PAUSE = 0.05
 
 
 def _call_method(window: Any, names: Sequence[str], *args: Any, **kwargs: Any) -> bool:
@@ -82,25 +96,34 @@ def _bool_attr(window: Any, names: Sequence[str], *, default: bool = False) -> b
     return default
 
 
-def _get_windows_with_title(title: str) -> list[Any]:
-    getter = getattr(pyautogui, "getWindowsWithTitle", None)
+@cache
+def _pyautogui_helper(name: str, message: str) -> Callable[..., Any]:
+    getter = getattr(pyautogui, name, None)
     if getter is None:
-        message = "PyAutoGUI window helpers are unavailable on this platform."
         raise RuntimeError(message)
+    return cast(Callable[..., Any], getter)
+
+
+def _get_windows_with_title(title: str) -> list[Any]:
+    getter = _pyautogui_helper(
+        "getWindowsWithTitle",
+        "PyAutoGUI window helpers are unavailable on this platform.",
+    )
     return list(getter(title))
 
 
 def _get_all_titles() -> list[str]:
-    getter = getattr(pyautogui, "getAllTitles", None)
-    if getter is None:
-        message = "PyAutoGUI title enumeration is unavailable on this platform."
-        raise RuntimeError(message)
+    getter = _pyautogui_helper(
+        "getAllTitles",
+        "PyAutoGUI title enumeration is unavailable on this platform.",
+    )
     return list(getter())
 
 
 def _run_subprocess(args: list[str], *, check: bool = True) -> None:
     print(f"Running: {' '.join(args)}")
-    subprocess.run(args, check=check, cwd=str(REPO_ROOT))  # noqa: S603
+    stdout = None if _automation_state["verbose"] else subprocess.DEVNULL
+    subprocess.run(args, check=check, cwd=REPO_ROOT, stdout=stdout)  # noqa: S603
 
 
 def rebuild_database() -> None:
@@ -109,10 +132,11 @@ def rebuild_database() -> None:
 
 
 def _launch_gui() -> subprocess.Popen[bytes]:
+    _configure_pyautogui()
     env = os.environ.copy()
     return subprocess.Popen(  # noqa: S603
         [sys.executable, str(MAIN_ENTRY)],
-        cwd=str(REPO_ROOT),
+        cwd=REPO_ROOT,
         env=env,
     )
 
@@ -127,16 +151,24 @@ def _terminate_process(process: subprocess.Popen[bytes]) -> None:
         process.kill()
 
 
+def _first_visible_window(title: str) -> Any | None:
+    for window in _get_windows_with_title(title):
+        if _bool_attr(window, ("isMinimized", "minimized", "is_minimized")):
+            _call_method(window, ("restore", "restoreWindow", "activate"))
+        if _bool_attr(window, ("isVisible", "visible", "is_visible"), default=True):
+            return window
+    return None
+
+
 def _wait_for_window(title: str, timeout: float = 15.0) -> Any | None:
     deadline = time.perf_counter() + timeout
+    delay = POLL_INITIAL_DELAY
     while time.perf_counter() < deadline:
-        windows = _get_windows_with_title(title)
-        for window in windows:
-            if _bool_attr(window, ("isMinimized", "minimized", "is_minimized")):
-                _call_method(window, ("restore", "restoreWindow", "activate"))
-            if _bool_attr(window, ("isVisible", "visible", "is_visible"), default=True):
-                return window
-        time.sleep(0.1)
+        window = _first_visible_window(title)
+        if window is not None:
+            return window
+        time.sleep(delay)
+        delay = min(delay * POLL_BACKOFF, POLL_MAX_DELAY)
     return None
 
 
@@ -148,6 +180,12 @@ def _activate_window(window: Any) -> None:
     except (AttributeError, OSError):
         pass
     time.sleep(0.5)
+    _absolute_coords.update(
+        {
+            name: _relative_to_absolute(window, rel_x, rel_y)
+            for name, (rel_x, rel_y) in RELATIVE_COORDS.items()
+        },
+    )
 
 
 def _window_bbox(window: Any) -> tuple[int, int, int, int]:
@@ -163,7 +201,8 @@ def _capture_window(window: Any, output: Path) -> None:
     bbox = _window_bbox(window)
     image = ImageGrab.grab(bbox)
     SCREENSHOT_DIR.mkdir(parents=True, exist_ok=True)
-    image.save(output)
+    # Captures are regenerated on every run, so favour encode speed over size.
+    image.save(output, optimize=False, compress_level=PNG_COMPRESS_LEVEL)
     print(f"Saved {output.relative_to(REPO_ROOT)}")
 
 
@@ -173,10 +212,18 @@ def _click_window_center(window: Any) -> None:
     pyautogui.click(x, y)
 
 
-def _click_rel(window: Any, rel_x: float, rel_y: float) -> None:
+def _relative_to_absolute(window: Any, rel_x: float, rel_y: float) -> tuple[int, int]:
     x = int(window.left + window.width * rel_x)
     y = int(window.top + window.height * rel_y)
-    pyautogui.click(x, y)
+    return x, y
+
+
+def _click_named(window: Any, name: str) -> None:
+    """Click a RELATIVE_COORDS target using the pixels cached on activation."""
+    coords = _absolute_coords.get(name)
+    if coords is None:
+        coords = _relative_to_absolute(window, *RELATIVE_COORDS[name])
+    pyautogui.click(*coords)
 
 
 def _type_text(text: str) -> None:
@@ -243,7 +290,7 @@ def _close_dialog_by_title(title: str, *, attempts: int = 3) -> None:
 def _create_sample_faction(window: Any) -> bool:
     print("Creating sample faction via UI...")
     window.activate()
-    _click_rel(window, *RELATIVE_COORDS["faction_combo"])
+    _click_named(window, "faction_combo")
     time.sleep(0.3)
     _press(("ctrl", "a"))
     _type_text(SAMPLE_FACTION_NAME)
@@ -311,15 +358,19 @@ def _capture_dialog(
     timeout: float = 6.0,
 ) -> None:
     deadline = time.perf_counter() + timeout
+    delay = POLL_INITIAL_DELAY
     dialog: Any | None = None
     while time.perf_counter() < deadline:
-        for title in _get_all_titles():
-            if title_matcher(title):
-                dialog = _wait_for_window(title, timeout=1.0)
-                break
+        title = next(filter(title_matcher, _get_all_titles()), None)
+        if title is not None:
+            dialog = _first_visible_window(title) or _wait_for_window(
+                title,
+                timeout=1.0,
+            )
         if dialog is not None:
             break
-        time.sleep(0.1)
+        time.sleep(delay)
+        delay = min(delay * POLL_BACKOFF, POLL_MAX_DELAY)
     if dialog is None:
         print(f"Dialog matching predicate not found for {output_name}.")
         return
@@ -330,7 +381,7 @@ def _capture_dialog(
 
 
 def _launch_relationship_dialog(window: Any) -> None:
-    _click_rel(window, *RELATIVE_COORDS["relationship_button"])
+    _click_named(window, "relationship_button")
     time.sleep(4)
     _capture_dialog(
         lambda title: RELATIONSHIP_TITLE.lower() in title.lower(),
@@ -447,7 +498,13 @@ def main(argv: Sequence[str] | None = None) -> int:
         action="store_true",
         help="Open the GUI just long enough to trigger the Relationships dialog.",
     )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Show output from helper subprocesses such as the database rebuild.",
+    )
     args = parser.parse_args(argv)
+    _automation_state["verbose"] = args.verbose
     if args.window_test:
         test_window()
     elif args.test_fire_relationship:
@@ -3,12 +3,35 @@
 from __future__ import annotations
 
 import getpass
+import sys
+from collections.abc import Iterator
 from pathlib import Path
 
 ENV_PATH = Path(__file__).resolve().parents[1] / ".env"
 
 
-def _prompt(field: str, *, default: str | None = None, secret: bool = False) -> str:
+def _piped_answers() -> Iterator[str] | None:
+    """Read every answer up front when stdin is not an interactive terminal."""
+    if sys.stdin.isatty():
+        return None
+    return iter(sys.stdin.read().splitlines())
+
+
+def _prompt(
+    field: str,
+    *,
+    default: str | None = None,
+    secret: bool = False,
+    answers: Iterator[str] | None = None,
+) -> str:
+    if answers is not None:
+        value = next(answers, "").strip()
+        if value:
+            return value
+        if default is not None:
+            return default
+        msg = f"{field} cannot be empty."
+        raise ValueError(msg)
     label = f"Enter {field}"
     if default:
         label += f" [{default}]"
@@ -24,11 +47,12 @@ def _prompt(field: str, *, default: str | None = None, secret: bool = False) ->
 
 
 def _build_env() -> str:
-    username = _prompt("DB username", default="final_project_user")
-    password = _prompt("DB password", secret=True)
-    host = _prompt("DB host", default="localhost")
-    port = _prompt("DB port", default="3306")
-    database = _prompt("DB name", default="final_project")
+    answers = _piped_answers()
+    username = _prompt("DB username", default="final_project_user", answers=answers)
+    password = _prompt("DB password", secret=True, answers=answers)
+    host = _prompt("DB host", default="localhost", answers=answers)
+    port = _prompt("DB port", default="3306", answers=answers)
+    database = _prompt("DB name", default="final_project", answers=answers)
     return (
         f"DB_USERNAME={username}\n"
         f"DB_PASSWORD={password}\n"
@@ -39,7 +63,11 @@ def _build_env() -> str:
 
 
 def _main() -> int:
-    content = _build_env()
+    try:
+        content = _build_env()
+    except ValueError as exc:
+        print(exc, file=sys.stderr)
+        return 1
     ENV_PATH.write_text(content, encoding="utf-8")
     print(f"Wrote credentials to {ENV_PATH}")
     return 0
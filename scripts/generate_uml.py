@@ -15,6 +15,8 @@ TARGET_FORMATS = ("eps", "png")
 IMAGES_DIR = DOCS_DIR / "images"
 ERD_PNG_SOURCE = DOCS_DIR / "erd.png"
 ERD_PNG_DEST = IMAGES_DIR / "erd.png"
+PIPE_FORMATS = frozenset({"png"})
+PIPE_DELIMITER = "__PLANTUML_DIAGRAM_END__"
 
 
 def _resolve_jar() -> Path:
@@ -28,11 +30,64 @@ def _target_path(source: Path, fmt: str) -> Path:
     return source.with_suffix(f".{fmt}")
 
 
-def _run_plantuml(jar: Path, uml_file: Path, fmt: str) -> None:
-    cmd = ["java", "-jar", str(jar), f"-t{fmt}", str(uml_file)]
+def _run_plantuml(jar: Path, uml_files: list[Path], fmt: str) -> None:
+    """Render every file in one JVM so startup cost is paid once per format."""
+    cmd = [
+        "java",
+        "-jar",
+        str(jar),
+        f"-t{fmt}",
+        f"-nbthread={os.cpu_count() or 1}",
+        *(str(uml) for uml in uml_files),
+    ]
     subprocess.run(cmd, check=True)  # noqa: S603
 
 
+def _render_pipe(jar: Path, uml_files: list[Path], fmt: str) -> bool:
+    """
+    Stream every diagram through one -pipe JVM and write each image ourselves.
+
+    Output lands on ``<file>.<fmt>`` regardless of the ``@startuml`` title, which
+    keeps ``ERD_PNG_SOURCE`` stable. Returns False when the rendered images do not
+    map one-to-one onto the input files (e.g. a file holding several diagrams).
+    """
+    cmd = [
+        "java",
+        "-jar",
+        str(jar),
+        "-pipe",
+        f"-t{fmt}",
+        "-pipedelimitor",
+        PIPE_DELIMITER,
+    ]
+    source = "\n".join(uml.read_text(encoding="utf-8") for uml in uml_files)
+    result = subprocess.run(  # noqa: S603
+        cmd,
+        input=source.encode("utf-8"),
+        capture_output=True,
+        check=True,
+    )
+    chunks = result.stdout.split(PIPE_DELIMITER.encode("utf-8"))
+    images = [image for chunk in chunks if (image := chunk.lstrip(b"\r\n"))]
+    if len(images) != len(uml_files):
+        return False
+    for uml, image in zip(uml_files, images, strict=True):
+        _target_path(uml, fmt).write_bytes(image)
+    return True
+
+
+def _report_failures(jar: Path, uml_files: list[Path], fmt: str) -> int:
+    """Re-render one file at a time to pinpoint which diagram failed."""
+    returncode = 1
+    for uml in uml_files:
+        try:
+            _run_plantuml(jar, [uml], fmt)
+        except subprocess.CalledProcessError as exc:
+            print(f"Failed to render {uml} as {fmt}: {exc}", file=sys.stderr)
+            returncode = exc.returncode or 1
+    return returncode
+
+
 def _move_erd_png() -> None:
     """Ensure docs/images contains the freshly rendered ERD PNG."""
     IMAGES_DIR.mkdir(parents=True, exist_ok=True)
@@ -55,15 +110,14 @@ def main() -> int:
     if not uml_files:
         print("No UML files found under docs/.")
         return 0
-    for uml in uml_files:
-        for fmt in TARGET_FORMATS:
-            target = _target_path(uml, fmt)
-            print(f"Rendering {uml} -> {target}")
-            try:
-                _run_plantuml(jar, uml, fmt)
-            except subprocess.CalledProcessError as exc:
-                print(f"Failed to render {uml} as {fmt}: {exc}", file=sys.stderr)
-                return exc.returncode or 1
+    for fmt in TARGET_FORMATS:
+        for uml in uml_files:
+            print(f"Rendering {uml} -> {_target_path(uml, fmt)}")
+        try:
+            if fmt not in PIPE_FORMATS or not _render_pipe(jar, uml_files, fmt):
+                _run_plantuml(jar, uml_files, fmt)
+        except subprocess.CalledProcessError:
+            return _report_failures(jar, uml_files, fmt)
     _move_erd_png()
     return 0
 
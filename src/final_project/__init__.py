@@ -11,6 +11,7 @@ import structlog
 import sys
 
 logger = structlog.getLogger("final_project")
+_MISSING = object()
 
 
 class SemanticSorter:
@@ -18,7 +19,7 @@ class SemanticSorter:
 
     def __init__(self, order: list[str]) -> None:
         """Initialize the processor order."""
-        self._order = order
+        self._order = tuple(order)
 
     def __call__(
         self,
@@ -26,9 +27,13 @@ class SemanticSorter:
         _method_name: str,
         event_dict: structlog.types.EventDict,
     ) -> structlog.types.EventDict:
-        """Sort the keys."""
-        ordered_dict = {k: v for k in self._order if (v := event_dict.pop(k, None))}
-        ordered_dict |= event_dict
+        """Sort the keys, dropping ordered keys that are missing or None."""
+        ordered_dict: structlog.types.EventDict = {}
+        for key in self._order:
+            value = event_dict.pop(key, _MISSING)
+            if value is not None and value is not _MISSING:
+                ordered_dict[key] = value
+        ordered_dict.update(event_dict)
         return ordered_dict
 
 
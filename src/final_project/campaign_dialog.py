@@ -8,8 +8,6 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from collections.abc import Sequence
-from typing import Any
-from typing import cast
 
 import customtkinter as ctk  # type: ignore[import-untyped]
 from lazi.core import lazi
@@ -18,9 +16,48 @@ from final_project import dialogs as dialogs_module
 from final_project.db import CAMPAIGN_STATUSES
 
 with lazi:  # type: ignore[attr-defined]
+    import re
+    import time
+    import tkinter as tk
+    from contextlib import suppress
     from datetime import UTC
+    from datetime import date
     from datetime import datetime
-    from tkinter import messagebox
+
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_SECONDS_PER_DAY = 86_400
+_DEFAULT_STATUS = CAMPAIGN_STATUSES[0]
+
+
+class _TodayCache:
+    def __init__(self) -> None:
+        self.day = -1
+        self.text = ""
+
+
+_TODAY = _TodayCache()
+
+
+def _today_iso() -> str:
+    """Return today's UTC date as YYYY-MM-DD, formatting it once per day."""
+    day = int(time.time() // _SECONDS_PER_DAY)
+    if day != _TODAY.day:
+        _TODAY.day = day
+        _TODAY.text = (
+            datetime.fromtimestamp(day * _SECONDS_PER_DAY, UTC).date().isoformat()
+        )
+    return _TODAY.text
+
+
+def _is_iso_date(text: str) -> bool:
+    """Return True for a real calendar date written as YYYY-MM-DD."""
+    if _ISO_DATE_RE.fullmatch(text) is None:
+        return False
+    try:
+        date.fromisoformat(text)
+    except ValueError:
+        return False
+    return True
 
 
 class CampaignDialog(ctk.CTkToplevel):  # type: ignore[misc]
@@ -40,64 +77,100 @@ class CampaignDialog(ctk.CTkToplevel):  # type: ignore[misc]
         self.title("New Campaign")
         self.resizable(width=False, height=False)
         self.transient(master)
-        self.grab_set()
 
         container = ctk.CTkFrame(self)
         container.pack(fill="both", expand=True, padx=20, pady=20)
+        # One grid lays the whole form out in a single geometry pass.
+        container.grid_columnconfigure(0, weight=1)
 
-        ctk.CTkLabel(container, text="Campaign Name:").pack(anchor="w")
+        ctk.CTkLabel(container, text="Campaign Name:").grid(row=0, sticky="w")
         self._name_entry = ctk.CTkEntry(container)
-        self._name_entry.pack(fill="x", pady=(0, 10))
+        self._name_entry.grid(row=1, sticky="ew", pady=(0, 10))
 
-        ctk.CTkLabel(container, text="Start Date (YYYY-MM-DD):").pack(anchor="w")
+        ctk.CTkLabel(container, text="Start Date (YYYY-MM-DD):").grid(
+            row=2,
+            sticky="w",
+        )
         self._date_entry = ctk.CTkEntry(container)
-        today_text = datetime.now(UTC).date().isoformat()
-        self._date_entry.insert(0, today_text)
-        self._date_entry.pack(fill="x", pady=(0, 10))
+        self._date_entry.insert(0, _today_iso())
+        self._date_entry.grid(row=3, sticky="ew", pady=(0, 10))
 
-        ctk.CTkLabel(container, text="Status:").pack(anchor="w")
+        ctk.CTkLabel(container, text="Status:").grid(row=4, sticky="w")
         self._status_combo = ctk.CTkComboBox(
             container,
-            values=list(CAMPAIGN_STATUSES),
+            values=CAMPAIGN_STATUSES,
             state="readonly",
         )
-        self._configure_status_combo(list(CAMPAIGN_STATUSES), CAMPAIGN_STATUSES[0])
-        self._status_combo.pack(fill="x", pady=(0, 10))
-
-        button_row = ctk.CTkFrame(container)
-        button_row.pack(fill="x", pady=(10, 0))
-        ctk.CTkButton(button_row, text="Cancel", command=self._handle_cancel).pack(
-            side="right",
-            padx=(0, 10),
+        self._configure_status_combo(CAMPAIGN_STATUSES, _DEFAULT_STATUS)
+        self._status_combo.grid(row=5, sticky="ew", pady=(0, 10))
+
+        self._error_label = ctk.CTkLabel(
+            container,
+            text="",
+            text_color=dialogs_module.ERROR_COLOR,
+            anchor="w",
+            justify="left",
         )
-        ctk.CTkButton(button_row, text="Create", command=self._handle_submit).pack(
-            side="right",
+        self._error_label.grid(row=6, sticky="ew")
+
+        button_row, _ = dialogs_module.build_button_row(
+            container,
+            on_cancel=self._handle_cancel,
+            on_submit=self._handle_submit,
+            submit_text="Create",
         )
+        button_row.grid(row=7, sticky="ew", pady=(10, 0))
 
-        self.bind("<Return>", lambda event: self._handle_submit())  # noqa: ARG005
+        self.bind("<Return>", self._handle_submit_event)
         self.protocol("WM_DELETE_WINDOW", self._handle_cancel)
+        # Take the grab only once the form is packed; transient keeps it on top.
+        self.grab_set()
         self._name_entry.focus_set()
 
     def _handle_submit(self) -> None:
         name = self._name_entry.get().strip()
         start_date = self._date_entry.get().strip()
-        status_combo = cast(Any, self._status_combo)
-        status = status_combo.get().strip().upper()
+        # The combo is readonly and only offers CAMPAIGN_STATUSES values.
+        status = self._status_combo.get()
+        errors: list[str] = []
         if not name:
-            messagebox.showerror("New Campaign", "Enter a campaign name.")
-            return
+            errors.append("Enter a campaign name.")
         if not start_date:
-            messagebox.showerror("New Campaign", "Enter a start date.")
-            return
+            errors.append("Enter a start date.")
+        elif not _is_iso_date(start_date):
+            errors.append("Enter the start date as YYYY-MM-DD.")
         if not status:
-            messagebox.showerror("New Campaign", "Select a campaign status.")
+            errors.append("Select a campaign status.")
+        # Every problem is listed under the form instead of in a modal box.
+        self._error_label.configure(text="\n".join(errors))
+        if errors:
             return
         self._on_submit(name, start_date, status)
 
+    def _handle_submit_event(self, _event: object = None) -> None:
+        self._handle_submit()
+
     def _handle_cancel(self) -> None:
         if self._on_cancel is not None:
             self._on_cancel()
-        self.destroy()
+        self.hide()
+
+    def show(self) -> None:
+        """Clear the form of a hidden dialog and display it again."""
+        self._error_label.configure(text="")
+        self._name_entry.delete(0, "end")
+        self._date_entry.delete(0, "end")
+        self._date_entry.insert(0, _today_iso())
+        self._configure_status_combo(CAMPAIGN_STATUSES, _DEFAULT_STATUS)
+        self.deiconify()
+        self.grab_set()
+        self._name_entry.focus_set()
+
+    def hide(self) -> None:
+        """Withdraw the dialog so show() can reuse its widgets."""
+        with suppress(tk.TclError):
+            self.grab_release()
+        self.withdraw()
 
     def _configure_status_combo(
         self,
@@ -105,6 +178,5 @@ class CampaignDialog(ctk.CTkToplevel):  # type: ignore[misc]
         current: str | None,
     ) -> None:
         combo_state = dialogs_module.build_combo_box_state(statuses, current)
-        status_combo = cast(Any, self._status_combo)
         self._status_combo.configure(values=combo_state.values)
-        status_combo.set(combo_state.selected)
+        self._status_combo.set(combo_state.selected)
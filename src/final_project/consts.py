@@ -1,11 +1,9 @@
 """Hold constants and enum values."""
 
-from lazi.core import lazi
-
-with lazi:  # type: ignore[attr-defined] # lazi has incorrectly typed code
-    import importlib.metadata
-    import logging
-    from enum import IntEnum
+import importlib.metadata
+import logging
+from enum import IntEnum
+from functools import cache
 
 
 class LogLevels(IntEnum):
@@ -18,6 +16,7 @@ class LogLevels(IntEnum):
     CRITICAL = logging.CRITICAL
 
 
+@cache
 def version() -> str:
     """Return version of the project that is installed."""
     return importlib.metadata.version("final_project")
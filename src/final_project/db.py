@@ -4,25 +4,38 @@ from lazi.core import lazi
 
 # does not work well with lazi
 from sqlalchemy import JSON
+from sqlalchemy import CursorResult
 from sqlalchemy import Engine
 from sqlalchemy import Enum
 from sqlalchemy import ForeignKey
 from sqlalchemy import ForeignKeyConstraint
 from sqlalchemy import Index
 from sqlalchemy import LargeBinary
+from sqlalchemy import Select
 from sqlalchemy import String
+from sqlalchemy import Table
 from sqlalchemy import Text
 from sqlalchemy import UniqueConstraint
+from sqlalchemy import bindparam
 from sqlalchemy import create_engine
+from sqlalchemy import delete
 from sqlalchemy import event
+from sqlalchemy import insert
+from sqlalchemy import or_
+from sqlalchemy import select
 from sqlalchemy import text
+from sqlalchemy import update
 from sqlalchemy.dialects.mysql import SMALLINT
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Dialect
 from sqlalchemy.engine.url import URL
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import Session as SessionType
 from sqlalchemy.orm import mapped_column
+from sqlalchemy.orm import raiseload
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import selectinload
 from sqlalchemy.orm import sessionmaker
@@ -49,13 +62,13 @@ with lazi:  # type: ignore[attr-defined] # lazi has incorrectly typed code
     from typing import cast
     from typing import runtime_checkable
 
+    import dotenv
     import structlog
+    import tabulate
     import yaml
     from beartype.vale import Is
-    from dotenv import load_dotenv
     from pydantic import BaseModel
     from pydantic import Field
-    from tabulate import tabulate
 
     from final_project import LogLevels
     from final_project.paths import PROJECT_ROOT
@@ -68,21 +81,16 @@ with lazi:  # type: ignore[attr-defined] # lazi has incorrectly typed code
 
 logger = structlog.getLogger("final_project")
 
-load_dotenv(PROJECT_ROOT / ".env")
-CONFIG_PATH = path_from_settings("config")
-SAMPLE_NPC_PATH = path_from_settings("sample_npc")
-SAMPLE_LOCATION_PATH = path_from_settings(
-    "sample_locations",
-)
-SAMPLE_ENCOUNTER_PATH = path_from_settings(
-    "sample_encounters",
-)
 CAMPAIGN_STATUSES: tuple[str, ...] = (
     "ACTIVE",
     "ONHOLD",
     "COMPLETED",
     "CANCELED",
 )
+CAMPAIGN_STATUS_SET: frozenset[str] = frozenset(CAMPAIGN_STATUSES)
+# Compiled-statement cache entries per engine; must stay nonzero.
+QUERY_CACHE_SIZE = 1200
+FACTION_CACHE_SIZE = 256
 
 
 # beartype annotations
@@ -91,7 +99,24 @@ type SmallInt = Annotated[int, Is[lambda x: isinstance(x, int) and 0 <= x <= 655
 LongBlob = LargeBinary(length=(2**32) - 1)  # Max length for LONGBLOB
 
 
+@cache
+def _load_env() -> None:
+    """Load the project .env file once, the first time a variable is needed."""
+    dotenv.load_dotenv(PROJECT_ROOT / ".env")
+
+
+@cache
+def _config_path() -> Path:
+    return path_from_settings("config")
+
+
+@cache
+def _sample_path(key: str) -> Path:
+    return path_from_settings(key)
+
+
 def _get_env_var(name: str) -> Any:
+    _load_env()
     ret = os.getenv(name)
     if ret is None:
         msg = f"Unable to find: {name} in environmental variables."
@@ -101,8 +126,7 @@ def _get_env_var(name: str) -> Any:
 
 @cache
 def _read_config() -> dict[str, Any]:
-    with CONFIG_PATH.open("rb") as file:
-        ret = tomllib.load(file)
+    ret = tomllib.loads(_config_path().read_bytes().decode("utf-8"))
     logger.debug("read config data", config=ret)
     return ret
 
@@ -112,9 +136,11 @@ def _load_sample_data(path: Path, label: str) -> list[dict[str, Any]]:
     if not path.exists():
         logger.error("%s file missing", label, path=str(path))
         return []
+    # Prefer the libyaml-backed loader when PyYAML was built with it.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
-        with path.open("r", encoding="utf-8") as file:
-            raw_data: Any = yaml.safe_load(file)
+        with path.open("rb") as file:
+            raw_data: Any = yaml.load(file, Loader=loader)  # noqa: S506
     except yaml.YAMLError:
         logger.exception("failed to parse %s yaml", label, path=str(path))
         return []
@@ -127,8 +153,9 @@ def _load_sample_data(path: Path, label: str) -> list[dict[str, Any]]:
     entries = cast(list[Any], raw_data)  # type: ignore[redundant-cast] #pyright gets confused
     for entry in entries:
         if isinstance(entry, Mapping):
-            entry = cast(Mapping[Any, Any], entry)  # type: ignore[redundant-cast] #pyright gets confused
-            samples.append({str(k): v for k, v in dict(entry).items()})
+            entry = cast(Mapping[str, Any], entry)
+            # Safe-loaded YAML mappings are already plain dicts; only copy others.
+            samples.append(entry if type(entry) is dict else dict(entry))
         else:
             logger.warning("skipping malformed %s entry", label, entry=entry)
     return samples
@@ -199,6 +226,7 @@ def _connector_factory() -> _Connector:
         engine = create_engine(
             db_url,
             echo=echo,
+            query_cache_size=QUERY_CACHE_SIZE,
         )  # echo=True for logging SQL statements
         try:
             with engine.connect():
@@ -379,6 +407,14 @@ class Encounter(CampaignRecord):
             "date",
             name="uq_encounter_campaign_location_date",
         ),
+        # Serves the sample-load dedupe (date IN ..., then description match);
+        # MySQL can only index a prefix of the TEXT column.
+        Index(
+            "ix_encounter_date_description",
+            "date",
+            "description",
+            mysql_length={"description": 255},
+        ),
         ForeignKeyConstraint(
             ["campaign_name", "location_name"],
             ["location.campaign_name", "location.name"],
@@ -641,7 +677,10 @@ class EncounterParticipants(Base):
     """Represents join table that holds which encounter has which members."""
 
     __tablename__ = "encounter_participants"
-    __table_args__ = (Index("ix_encounter_participants_encounter", "encounter_id"),)
+    # Leading encounter_id serves the participant list; npc_id covers its join.
+    __table_args__ = (
+        Index("ix_encounter_participants_encounter", "encounter_id", "npc_id"),
+    )
     npc_id: Mapped[int] = mapped_column(
         ForeignKey(
             "npc.id",
@@ -727,13 +766,32 @@ def _entry_name(entry: Mapping[str, Any]) -> str:
     return str(entry.get("name", "")).strip()
 
 
+def _sample_cache(session: SessionType, key: str) -> dict[str, Any]:
+    """Return a per-session memo so repeated sample references skip lookups."""
+    return cast(dict[str, Any], session.info.setdefault(key, {}))
+
+
+def _sample_image_bytes(session: SessionType, value: Any) -> bytes | None:
+    """Read a sample image once per session and share the bytes between records."""
+    image_path = _coerce_optional_path(value)
+    if image_path is None:
+        return None
+    cache: dict[str, bytes | None] = _sample_cache(session, "sample_images")
+    key = str(image_path)
+    if key not in cache:
+        cache[key] = _read_image_bytes(image_path)
+    return cache[key]
+
+
 def _campaign_from_data(
     session: SessionType,
     campaign_data: Mapping[str, Any],
 ) -> Campaign:
     campaign_name = str(campaign_data["name"])
-    campaign = session.get(Campaign, campaign_name)
+    cache: dict[str, Campaign] = _sample_cache(session, "sample_campaigns")
+    campaign = cache.get(campaign_name) or session.get(Campaign, campaign_name)
     if campaign is not None:
+        cache[campaign_name] = campaign
         return campaign
     start_date = dtdate.fromisoformat(str(campaign_data["start_date"]))
     status = str(campaign_data["status"]).upper()
@@ -743,6 +801,7 @@ def _campaign_from_data(
         status=status,
     )
     session.add(campaign)
+    cache[campaign_name] = campaign
     return campaign
 
 
@@ -751,8 +810,10 @@ def _species_from_data(
     species_data: Mapping[str, Any],
 ) -> Species:
     species_name = str(species_data["name"])
-    species = session.get(Species, species_name)
+    cache: dict[str, Species] = _sample_cache(session, "sample_species")
+    species = cache.get(species_name) or session.get(Species, species_name)
     if species is not None:
+        cache[species_name] = species
         return species
     traits_source = species_data.get("traits", {})
     if isinstance(traits_source, str):
@@ -764,6 +825,7 @@ def _species_from_data(
         traits_json=traits_text,
     )
     session.add(species)
+    cache[species_name] = species
     return species
 
 
@@ -773,11 +835,22 @@ def _location_from_data(
     default_campaign: Campaign,
 ) -> Location:
     location_name = str(location_data["name"])
-    location = (
-        session.query(Location).filter(Location.name == location_name).one_or_none()
-    )
+    location = session.scalars(
+        select(Location).where(Location.name == location_name),
+    ).one_or_none()
     if location is not None:
         return location
+    location = _new_location_from_data(session, location_data, default_campaign)
+    session.add(location)
+    return location
+
+
+def _new_location_from_data(
+    session: SessionType,
+    location_data: Mapping[str, Any],
+    default_campaign: Campaign,
+) -> Location:
+    location_name = str(location_data["name"])
     campaign = default_campaign
     override_campaign = location_data.get("campaign")
     if isinstance(override_campaign, Mapping):
@@ -785,8 +858,7 @@ def _location_from_data(
             session,
             cast(Mapping[str, Any], override_campaign),
         )
-    image_path = _coerce_optional_path(location_data.get("image_path"))
-    image_blob = _read_image_bytes(image_path)
+    image_blob = _sample_image_bytes(session, location_data.get("image_path"))
     location = Location(
         name=location_name,
         type=str(location_data["type"]).upper(),
@@ -794,25 +866,37 @@ def _location_from_data(
         campaign=campaign,
     )
     _attach_image_blob(location, image_blob)
-    session.add(location)
     return location
 
 
+def _existing_names(
+    session: SessionType,
+    column: Mapped[str],
+    names: set[str],
+) -> set[str]:
+    """Return which of ``names`` already exist, using a single IN query."""
+    if not names:
+        return set()
+    return set(session.scalars(select(column).where(column.in_(names))))
+
+
 def _load_all_sample_npcs(session: SessionType) -> int:
-    samples = _load_sample_data(SAMPLE_NPC_PATH, "sample npc")
-    created = 0
+    samples = _load_sample_data(_sample_path("sample_npc"), "sample npc")
+    existing = _existing_names(
+        session,
+        NPC.name,
+        {name for sample in samples if (name := _entry_name(sample))},
+    )
+    pending: list[NPC] = []
     for sample in samples:
         npc_name = _entry_name(sample)
-        if not npc_name:
-            continue
-        exists = session.query(NPC).filter(NPC.name == npc_name).one_or_none()
-        if exists is not None:
+        if not npc_name or npc_name in existing:
             continue
+        existing.add(npc_name)
         alignment = str(sample["alignment_name"]).upper()
         abilities_source = dict(sample.get("abilities", {}))
         abilities = {str(k): v for k, v in abilities_source.items()}
-        image_path = _coerce_optional_path(sample.get("image_path"))
-        image_blob = _read_image_bytes(image_path)
+        image_blob = _sample_image_bytes(session, sample.get("image_path"))
         description = str(sample["description"])
         age = int(sample["age"])
         gender_value = (
@@ -833,48 +917,58 @@ def _load_all_sample_npcs(session: SessionType) -> int:
             abilities_json=abilities,
         )
         _attach_image_blob(npc, image_blob)
-        session.add(npc)
-        created += 1
-    return created
+        pending.append(npc)
+    session.add_all(pending)
+    return len(pending)
 
 
 def _load_all_sample_locations(session: SessionType) -> int:
-    samples = _load_sample_data(SAMPLE_LOCATION_PATH, "sample location")
-    created = 0
+    samples = _load_sample_data(
+        _sample_path("sample_locations"),
+        "sample location",
+    )
+    existing = _existing_names(
+        session,
+        Location.name,
+        {name for sample in samples if (name := _entry_name(sample))},
+    )
+    pending: list[Location] = []
     for sample in samples:
         location_name = _entry_name(sample)
-        if not location_name:
-            continue
-        exists = (
-            session.query(Location).filter(Location.name == location_name).one_or_none()
-        )
-        if exists is not None:
+        if not location_name or location_name in existing:
             continue
+        existing.add(location_name)
         campaign = _campaign_from_data(
             session,
             cast(Mapping[str, Any], sample["campaign"]),
         )
-        _location_from_data(session, sample, campaign)
-        created += 1
-    return created
+        pending.append(_new_location_from_data(session, sample, campaign))
+    session.add_all(pending)
+    return len(pending)
 
 
 def _load_all_sample_encounters(session: SessionType) -> int:
-    samples = _load_sample_data(SAMPLE_ENCOUNTER_PATH, "sample encounter")
-    created = 0
+    samples = _load_sample_data(
+        _sample_path("sample_encounters"),
+        "sample encounter",
+    )
+    dates = {dtdate.fromisoformat(str(sample["date"])) for sample in samples}
+    existing: set[tuple[str, dtdate]] = set()
+    if dates:
+        rows = session.execute(
+            select(Encounter.description, Encounter.date).where(
+                Encounter.date.in_(dates),
+            ),
+        )
+        existing = {(description, date) for description, date in rows}
+    pending: list[Encounter] = []
     for sample in samples:
         description = str(sample["description"])
         date_value = dtdate.fromisoformat(str(sample["date"]))
-        exists = (
-            session.query(Encounter)
-            .filter(Encounter.description == description)
-            .filter(Encounter.date == date_value)
-            .one_or_none()
-        )
-        if exists is not None:
+        if (description, date_value) in existing:
             continue
-        image_path = _coerce_optional_path(sample.get("image_path"))
-        image_blob = _read_image_bytes(image_path)
+        existing.add((description, date_value))
+        image_blob = _sample_image_bytes(session, sample.get("image_path"))
         campaign = _campaign_from_data(
             session,
             cast(Mapping[str, Any], sample["campaign"]),
@@ -888,33 +982,25 @@ def _load_all_sample_encounters(session: SessionType) -> int:
             description=description,
         )
         _attach_image_blob(encounter, image_blob)
-        session.add(encounter)
-        created += 1
-    return created
+        pending.append(encounter)
+    session.add_all(pending)
+    return len(pending)
 
 
 def load_all_sample_data() -> dict[str, int]:
     """Load every bundled sample NPC, location, and encounter definition."""
-    session = get_session()
     results = {"campaigns": 0, "locations": 0, "npcs": 0, "encounters": 0}
-    try:
+    with get_session() as session, session.begin():
         engine = session.get_bind() or connect()
         Base.metadata.create_all(engine)
-        existing_campaigns = {name for (name,) in session.query(Campaign.name).all()}
+        existing_campaigns = set(session.scalars(select(Campaign.name)))
         results["locations"] = _load_all_sample_locations(session)
         results["npcs"] = _load_all_sample_npcs(session)
         results["encounters"] = _load_all_sample_encounters(session)
         session.flush()
-        current_campaigns = {name for (name,) in session.query(Campaign.name).all()}
+        current_campaigns = set(session.scalars(select(Campaign.name)))
         results["campaigns"] = len(current_campaigns - existing_campaigns)
-    except Exception:
-        session.rollback()
-        raise
-    else:
-        session.commit()
-        return results
-    finally:
-        session.close()
+    return results
 
 
 def _format_faction_entry(membership: FactionMembers) -> str:
@@ -955,17 +1041,26 @@ def _format_relationships(npc: NPC) -> str:
 def list_all_npcs(session: SessionType) -> None:
     """Return all NPCs currently stored in the database."""
     try:
-        npcs = (
-            session.query(NPC)
+        # Eager-load exactly what the table renders; raiseload turns any other
+        # relationship access (including the joined image blobs) into an error
+        # instead of a silent per-row query.
+        npcs = session.scalars(
+            select(NPC)
             .options(
-                selectinload(NPC.campaign),
-                selectinload(NPC.factions).selectinload(FactionMembers.faction),
-                selectinload(NPC.relationships).selectinload(Relationship.target),
-                selectinload(NPC.related_to).selectinload(Relationship.origin),
+                selectinload(NPC.campaign).raiseload("*"),
+                selectinload(NPC.factions)
+                .selectinload(FactionMembers.faction)
+                .raiseload("*"),
+                selectinload(NPC.relationships)
+                .selectinload(Relationship.target)
+                .raiseload("*"),
+                selectinload(NPC.related_to)
+                .selectinload(Relationship.origin)
+                .raiseload("*"),
+                raiseload("*"),
             )
-            .order_by(NPC.campaign_name, NPC.name)
-            .all()
-        )
+            .order_by(NPC.campaign_name, NPC.name),
+        ).all()
         if not npcs:
             print("No NPCs found.")
             return
@@ -998,28 +1093,73 @@ def list_all_npcs(session: SessionType) -> None:
                 },
             )
 
-        print(tabulate(rows, headers="keys", tablefmt="github"))
+        print(tabulate.tabulate(rows, headers="keys", tablefmt="github"))
     finally:
         session.close()
 
 
+# Name-list statements are built once so every call reuses the same cache key;
+# the campaign filter is a bound parameter rather than a fresh WHERE clause.
+_CAMPAIGN_NAMES = select(Campaign.name).order_by(Campaign.name)
+_NPC_NAMES = select(NPC.name).order_by(NPC.name)
+_NPC_NAMES_BY_CAMPAIGN = (
+    select(NPC.name)
+    .where(NPC.campaign_name == bindparam("campaign"))
+    .order_by(NPC.name)
+)
+_SPECIES_NAMES = select(Species.name).order_by(Species.name)
+_SPECIES_NAMES_BY_CAMPAIGN = (
+    select(Species.name)
+    .join(NPC, NPC.species_name == Species.name)
+    .where(NPC.campaign_name == bindparam("campaign"))
+    .distinct()
+    .order_by(Species.name)
+)
+_LOCATION_NAMES = select(Location.name).order_by(Location.name)
+_LOCATION_NAMES_BY_CAMPAIGN = (
+    select(Location.name)
+    .where(Location.campaign_name == bindparam("campaign"))
+    .order_by(Location.name)
+)
+_FACTION_NAMES = select(Faction.name).order_by(Faction.name)
+_FACTION_NAMES_BY_CAMPAIGN = (
+    select(Faction.name)
+    .where(Faction.campaign_name == bindparam("campaign"))
+    .order_by(Faction.name)
+)
+
+
+def _names(
+    session: SessionType,
+    statement: Select[str],
+    by_campaign: Select[str],
+    campaign: str | None,
+) -> list[str]:
+    """Run a prebuilt name-list statement, filtered by campaign when given."""
+    # Plain strings need no ORM result processing; run on the Core connection.
+    connection = session.connection()
+    if campaign:
+        return list(connection.scalars(by_campaign, {"campaign": campaign}))
+    return list(connection.scalars(statement))
+
+
 def get_campaigns() -> list[str]:
     """Return a list of campaign names from the database."""
-    session = SessionType(bind=connect())
-    try:
-        campaigns = session.query(Campaign).all()
-        return [campaign.name for campaign in campaigns]
-    finally:
-        session.close()
+    with get_session() as session:
+        return list(session.connection().scalars(_CAMPAIGN_NAMES))
 
 
-def _get_campaign(session: SessionType, name: str) -> Campaign:
-    """Return the Campaign with the given name, or raise ValueError if not found."""
-    campaign = session.get(Campaign, name)
-    if campaign is None:
+def _delete_campaign_row(session: SessionType, name: str) -> None:
+    """Delete the Campaign row, or raise ValueError if it does not exist."""
+    # Every dependent table declares ON DELETE CASCADE, so one statement lets the
+    # server remove the campaign's records instead of the ORM loading them first.
+    result = cast(
+        CursorResult[Any],
+        session.execute(delete(Campaign).where(Campaign.name == name)),
+    )
+    if result.rowcount == 0:
         msg = f"Campaign '{name}' does not exist."
         raise ValueError(msg)
-    return campaign
 
 
 def delete_campaign(name: str) -> None:
@@ -1028,21 +1168,14 @@ def delete_campaign(name: str) -> None:
     if not normalized or normalized in {"No Campaigns", "New Campaign"}:
         msg = "Select a campaign before attempting to delete it."
         raise ValueError(msg)
-    session = get_session()
     try:
-        campaign = _get_campaign(session, normalized)
-        session.delete(campaign)
-        session.commit()
+        with get_session() as session, session.begin():
+            _delete_campaign_row(session, normalized)
     except SQLAlchemyError as exc:
-        session.rollback()
         logger.exception("failed to delete campaign", campaign=normalized)
         msg = "Unable to delete the campaign. Check logs for details."
         raise RuntimeError(msg) from exc
-    except ValueError:
-        session.rollback()
-        raise
-    finally:
-        session.close()
+    clear_faction_caches()
 
 
 def create_campaign(
@@ -1064,196 +1197,211 @@ def create_campaign(
     else:
         date_value = start_date
     status_value = status.strip().upper()
-    if status_value not in CAMPAIGN_STATUSES:
+    if status_value not in CAMPAIGN_STATUS_SET:
         allowed = ", ".join(CAMPAIGN_STATUSES)
         msg = f"Campaign status must be one of: {allowed}."
         raise ValueError(msg)
-    session = get_session()
     try:
-        existing = session.get(Campaign, normalized_name)
-        if existing is not None:
-            msg = f"Campaign '{normalized_name}' already exists."
-            raise ValueError(msg)
-        campaign = Campaign(
-            name=normalized_name,
-            start_date=date_value,
-            status=status_value,
-        )
-        session.add(campaign)
-        session.commit()
+        with get_session() as session, session.begin():
+            existing = session.get(Campaign, normalized_name)
+            if existing is not None:
+                msg = f"Campaign '{normalized_name}' already exists."
+                raise ValueError(msg)
+            campaign = Campaign(
+                name=normalized_name,
+                start_date=date_value,
+                status=status_value,
+            )
+            session.add(campaign)
     except SQLAlchemyError as exc:
-        session.rollback()
         logger.exception("failed to create campaign", campaign=normalized_name)
         msg = "Unable to create the campaign. Check logs for details."
         raise RuntimeError(msg) from exc
-    else:
-        return campaign
-    finally:
-        session.close()
+    return campaign
 
 
 def get_npcs(campaign: str | None = None) -> list[str]:
     """Return a list of NPC names from the database, optionally filtered by campaign."""
-    session = SessionType(bind=connect())
-    try:
-        query = session.query(NPC)
-        if campaign:
-            query = query.filter(NPC.campaign_name == campaign)
-        npcs = query.order_by(NPC.name).all()
-        return [npc.name for npc in npcs]
-    finally:
-        session.close()
+    with get_session() as session:
+        return _names(session, _NPC_NAMES, _NPC_NAMES_BY_CAMPAIGN, campaign)
 
 
 def get_npc_identity_rows(
     campaign: str | None = None,
 ) -> list[tuple[int, str, str]]:
     """Return (id, name, campaign_name) rows for NPCs, optionally filtered."""
-    session = SessionType(bind=connect())
-    try:
-        query = session.query(NPC.id, NPC.name, NPC.campaign_name)
+    with get_session() as session:
+        statement = select(NPC.id, NPC.name, NPC.campaign_name).order_by(NPC.name)
         if campaign:
-            query = query.filter(NPC.campaign_name == campaign)
-        rows = query.order_by(NPC.name).all()
+            statement = statement.where(NPC.campaign_name == campaign)
+        rows = session.execute(statement).all()
         return [(npc_id, name, campaign_name) for npc_id, name, campaign_name in rows]
-    finally:
-        session.close()
 
 
 def get_species(campaign: str | None = None) -> list[str]:
     """Return species names, optionally restricted to a single campaign."""
-    session = SessionType(bind=connect())
-    try:
-        if campaign:
-            query = (
-                session.query(Species.name)
-                .join(NPC, NPC.species_name == Species.name)
-                .filter(NPC.campaign_name == campaign)
-                .distinct()
-                .order_by(Species.name)
-            )
-            return [name for (name,) in query.all()]
-        species_list = session.query(Species).order_by(Species.name).all()
-        return [species.name for species in species_list]
-    finally:
-        session.close()
+    with get_session() as session:
+        return _names(
+            session,
+            _SPECIES_NAMES,
+            _SPECIES_NAMES_BY_CAMPAIGN,
+            campaign,
+        )
 
 
 def get_locations(campaign: str | None = None) -> list[str]:
     """Return a list of location names, optionally filtered by campaign."""
-    session = SessionType(bind=connect())
-    try:
-        query = session.query(Location)
-        if campaign:
-            query = query.filter(Location.campaign_name == campaign)
-        locations = query.order_by(Location.name).all()
-        return [location.name for location in locations]
-    finally:
-        session.close()
+    with get_session() as session:
+        return _names(
+            session,
+            _LOCATION_NAMES,
+            _LOCATION_NAMES_BY_CAMPAIGN,
+            campaign,
+        )
 
 
 def core_tables_empty() -> bool:
     """Return True when the NPC, location, and encounter tables have no rows."""
-    session = get_session()
-    try:
-        npc_missing = session.query(NPC.id).limit(1).first() is None
-        location_missing = session.query(Location.id).limit(1).first() is None
-        encounter_missing = session.query(Encounter.id).limit(1).first() is None
-        return npc_missing and location_missing and encounter_missing
-    finally:
-        session.close()
+    with get_session() as session:
+        any_rows = session.scalar(
+            select(
+                or_(
+                    select(NPC.id).exists(),
+                    select(Location.id).exists(),
+                    select(Encounter.id).exists(),
+                ),
+            ),
+        )
+        return not any_rows
 
 
 def get_factions(campaign: str | None = None) -> list[str]:
     """Return faction names, optionally filtered by campaign."""
-    session = SessionType(bind=connect())
-    try:
-        query = session.query(Faction)
-        if campaign:
-            query = query.filter(Faction.campaign_name == campaign)
-        factions = query.order_by(Faction.name).all()
-        return [faction.name for faction in factions]
-    finally:
-        session.close()
+    with get_session() as session:
+        return _names(
+            session,
+            _FACTION_NAMES,
+            _FACTION_NAMES_BY_CAMPAIGN,
+            campaign,
+        )
+
+
+# Form refreshes repeat these lookups; the faction writers invalidate entries.
+_faction_details_cache: dict[str, tuple[str, str] | None] = {}
+_faction_membership_cache: dict[int, tuple[str, str] | None] = {}
+
+
+def _remember[K, V](cache: dict[K, V], key: K, value: V) -> V:
+    """Store the value, evicting the oldest entry once the cache is full."""
+    if len(cache) >= FACTION_CACHE_SIZE:
+        del cache[next(iter(cache))]
+    cache[key] = value
+    return value
 
 
 def get_faction_details(name: str) -> tuple[str, str] | None:
     """Return (description, campaign_name) for a faction."""
-    session = SessionType(bind=connect())
-    try:
-        faction = session.query(Faction).filter(Faction.name == name).one_or_none()
-        if faction is None:
-            return None
-        return faction.description, faction.campaign_name
-    finally:
-        session.close()
+    if name in _faction_details_cache:
+        return _faction_details_cache[name]
+    with get_session() as session:
+        faction = session.get(Faction, name)
+        details = (
+            None if faction is None else (faction.description, faction.campaign_name)
+        )
+    return _remember(_faction_details_cache, name, details)
 
 
 def get_faction_membership(npc_id: int) -> tuple[str, str] | None:
     """Return the first faction membership (name, notes) for the NPC id."""
-    session = SessionType(bind=connect())
-    try:
-        membership = (
-            session.query(FactionMembers)
-            .filter(FactionMembers.npc_id == npc_id)
+    if npc_id in _faction_membership_cache:
+        return _faction_membership_cache[npc_id]
+    with get_session() as session:
+        membership = session.scalars(
+            select(FactionMembers)
+            .where(FactionMembers.npc_id == npc_id)
             .order_by(FactionMembers.faction_name)
-            .first()
+            .limit(1),
+        ).first()
+        entry = (
+            None if membership is None else (membership.faction_name, membership.notes)
         )
-        if membership is None:
-            return None
-        return membership.faction_name, membership.notes
-    finally:
-        session.close()
+    return _remember(_faction_membership_cache, npc_id, entry)
+
+
+def clear_faction_caches() -> None:
+    """Drop memoized faction details and memberships."""
+    _faction_details_cache.clear()
+    _faction_membership_cache.clear()
+
+
+def _upsert(
+    session: SessionType,
+    model: type[Base],
+    keys: tuple[str, ...],
+    values: dict[str, Any],
+) -> None:
+    """Insert the row, or update its non-key columns when ``keys`` already match."""
+    updates = {column: value for column, value in values.items() if column not in keys}
+    dialect = session.get_bind().dialect.name
+    if dialect == "mysql":
+        session.execute(
+            mysql_insert(model).values(values).on_duplicate_key_update(updates),
+        )
+        return
+    if dialect == "sqlite":
+        session.execute(
+            sqlite_insert(model)
+            .values(values)
+            .on_conflict_do_update(index_elements=list(keys), set_=updates),
+        )
+        return
+    matched = cast(
+        CursorResult[Any],
+        session.execute(
+            update(model)
+            .where(*(getattr(model, key) == values[key] for key in keys))
+            .values(updates),
+        ),
+    )
+    if matched.rowcount == 0:
+        session.execute(insert(model).values(values))
 
 
 def upsert_faction(name: str, description: str, campaign_name: str) -> None:
     """Create or update a faction definition."""
-    session = get_session()
     try:
-        faction = session.query(Faction).filter(Faction.name == name).one_or_none()
-        if faction is None:
-            faction = Faction(
-                name=name,
-                description=description,
-                campaign_name=campaign_name,
+        with get_session() as session, session.begin():
+            _upsert(
+                session,
+                Faction,
+                ("name",),
+                {
+                    "name": name,
+                    "description": description,
+                    "campaign_name": campaign_name,
+                },
             )
-            session.add(faction)
-        else:
-            faction.description = description
-            faction.campaign_name = campaign_name
-        session.commit()
     except SQLAlchemyError as exc:
-        session.rollback()
         logger.exception("failed to save faction", faction=name)
         msg = "Unable to save the faction. Check logs for details."
         raise RuntimeError(msg) from exc
-    finally:
-        session.close()
+    _faction_details_cache.pop(name, None)
 
 
 def assign_faction_member(npc_id: int, faction_name: str, notes: str) -> None:
     """Assign an NPC to a faction, replacing previous memberships."""
-    session = get_session()
     try:
-        npc = session.get(NPC, npc_id)
-        if npc is None:
-            session.rollback()
-            msg = "Select a valid NPC before assigning a faction."
-            raise ValueError(msg)
-        (
-            session.query(FactionMembers)
-            .filter(FactionMembers.npc_id == npc_id)
-            .delete(synchronize_session=False)
-        )
-        member = FactionMembers(
-            faction_name=faction_name,
-            npc_id=npc_id,
-            notes=notes,
-        )
-        session.add(member)
-        session.commit()
+        with get_session() as session, session.begin():
+            if session.scalar(select(NPC.id).where(NPC.id == npc_id)) is None:
+                msg = "Select a valid NPC before assigning a faction."
+                raise ValueError(msg)
+            _upsert(
+                session,
+                FactionMembers,
+                ("npc_id",),
+                {"npc_id": npc_id, "faction_name": faction_name, "notes": notes},
+            )
     except SQLAlchemyError as exc:
-        session.rollback()
         logger.exception(
             "failed to assign faction membership",
             npc_id=npc_id,
@@ -1261,52 +1409,40 @@ def assign_faction_member(npc_id: int, faction_name: str, notes: str) -> None:
         )
         msg = "Unable to update the faction membership. Check logs for details."
         raise RuntimeError(msg) from exc
-    finally:
-        session.close()
+    _faction_membership_cache.pop(npc_id, None)
 
 
 def clear_faction_membership(npc_id: int) -> None:
     """Remove any faction memberships for the specified NPC."""
-    session = get_session()
     try:
-        npc = session.get(NPC, npc_id)
-        if npc is None:
-            return
-        (
-            session.query(FactionMembers)
-            .filter(FactionMembers.npc_id == npc_id)
-            .delete(synchronize_session=False)
-        )
-        session.commit()
+        with get_session() as session, session.begin():
+            session.execute(
+                delete(FactionMembers).where(FactionMembers.npc_id == npc_id),
+            )
     except SQLAlchemyError as exc:
-        session.rollback()
         logger.exception("failed to clear faction membership", npc_id=npc_id)
         msg = "Unable to clear the faction membership. Check logs for details."
         raise RuntimeError(msg) from exc
-    finally:
-        session.close()
+    _faction_membership_cache.pop(npc_id, None)
 
 
 def get_encounter_participants(encounter_id: int) -> list[tuple[int, str, str | None]]:
     """Return (npc_id, npc_name, notes) rows for the encounter."""
-    session = get_session()
-    try:
-        rows = (
-            session.query(NPC.id, NPC.name, EncounterParticipants.notes)
-            .join(NPC, NPC.id == EncounterParticipants.npc_id)
-            .filter(EncounterParticipants.encounter_id == encounter_id)
-            .order_by(NPC.name)
-            .all()
-        )
+    with get_session() as session:
+        try:
+            rows = session.execute(
+                select(NPC.id, NPC.name, EncounterParticipants.notes)
+                .join(NPC, NPC.id == EncounterParticipants.npc_id)
+                .where(EncounterParticipants.encounter_id == encounter_id)
+                .order_by(NPC.name),
+            ).all()
+        except SQLAlchemyError:
+            logger.exception(
+                "failed to load encounter participants",
+                encounter=encounter_id,
+            )
+            return []
         return [(npc_id, npc_name, notes) for npc_id, npc_name, notes in rows]
-    except SQLAlchemyError:
-        logger.exception(
-            "failed to load encounter participants",
-            encounter=encounter_id,
-        )
-        return []
-    finally:
-        session.close()
 
 
 def upsert_encounter_participant(
@@ -1315,38 +1451,27 @@ def upsert_encounter_participant(
     notes: str,
 ) -> None:
     """Insert or update a participant row for the encounter."""
-    session = get_session()
     try:
-        encounter = session.get(Encounter, encounter_id)
-        if encounter is None:
-            session.rollback()
-            msg = "Save the encounter before editing participants."
-            raise ValueError(msg)
-        npc = session.get(NPC, npc_id)
-        if npc is None:
-            session.rollback()
-            msg = "Select a valid NPC before adding them to the encounter."
-            raise ValueError(msg)
-        participant = (
-            session.query(EncounterParticipants)
-            .filter(
-                EncounterParticipants.encounter_id == encounter_id,
-                EncounterParticipants.npc_id == npc.id,
+        with get_session() as session, session.begin():
+            encounter_found, npc_found = session.execute(
+                select(
+                    select(Encounter.id).where(Encounter.id == encounter_id).exists(),
+                    select(NPC.id).where(NPC.id == npc_id).exists(),
+                ),
+            ).one()
+            if not encounter_found:
+                msg = "Save the encounter before editing participants."
+                raise ValueError(msg)
+            if not npc_found:
+                msg = "Select a valid NPC before adding them to the encounter."
+                raise ValueError(msg)
+            _upsert(
+                session,
+                EncounterParticipants,
+                ("encounter_id", "npc_id"),
+                {"encounter_id": encounter_id, "npc_id": npc_id, "notes": notes},
             )
-            .one_or_none()
-        )
-        if participant is None:
-            participant = EncounterParticipants(
-                encounter_id=encounter_id,
-                npc_id=npc.id,
-                notes=notes,
-            )
-            session.add(participant)
-        else:
-            participant.notes = notes
-        session.commit()
     except SQLAlchemyError as exc:
-        session.rollback()
         logger.exception(
             "failed to update encounter participant",
             encounter=encounter_id,
@@ -1354,25 +1479,19 @@ def upsert_encounter_participant(
         )
         msg = "Unable to update encounter participants. Check logs for details."
         raise RuntimeError(msg) from exc
-    finally:
-        session.close()
 
 
 def delete_encounter_participant(encounter_id: int, npc_id: int) -> None:
     """Remove the NPC from the encounter participants list."""
-    session = get_session()
     try:
-        (
-            session.query(EncounterParticipants)
-            .filter(
-                EncounterParticipants.encounter_id == encounter_id,
-                EncounterParticipants.npc_id == npc_id,
+        with get_session() as session, session.begin():
+            session.execute(
+                delete(EncounterParticipants).where(
+                    EncounterParticipants.encounter_id == encounter_id,
+                    EncounterParticipants.npc_id == npc_id,
+                ),
             )
-            .delete(synchronize_session=False)
-        )
-        session.commit()
     except SQLAlchemyError as exc:
-        session.rollback()
         logger.exception(
             "failed to delete encounter participant",
             encounter=encounter_id,
@@ -1380,8 +1499,6 @@ def delete_encounter_participant(encounter_id: int, npc_id: int) -> None:
         )
         msg = "Unable to remove the encounter participant. Check logs for details."
         raise RuntimeError(msg) from exc
-    finally:
-        session.close()
 
 
 def is_text_column(column: Any) -> bool:
@@ -1391,24 +1508,21 @@ def is_text_column(column: Any) -> bool:
 
 def get_relationship_rows(source_id: int) -> list[tuple[int, str, str]]:
     """Return (target_id, target_name, relation_name) rows for the NPC."""
-    session = get_session()
-    try:
-        rows = (
-            session.query(NPC.id, NPC.name, Relationship.name)
-            .join(NPC, NPC.id == Relationship.npc_id_2)
-            .filter(Relationship.npc_id_1 == source_id)
-            .order_by(NPC.name)
-            .all()
-        )
+    with get_session() as session:
+        try:
+            rows = session.execute(
+                select(NPC.id, NPC.name, Relationship.name)
+                .join(NPC, NPC.id == Relationship.npc_id_2)
+                .where(Relationship.npc_id_1 == source_id)
+                .order_by(NPC.name),
+            ).all()
+        except SQLAlchemyError:
+            logger.exception("failed to load relationships", npc_id=source_id)
+            return []
         return [
             (target_id, target_name, relation)
             for target_id, target_name, relation in rows
         ]
-    except SQLAlchemyError:
-        logger.exception("failed to load relationships", npc_id=source_id)
-        return []
-    finally:
-        session.close()
 
 
 def save_relationship(
@@ -1420,66 +1534,45 @@ def save_relationship(
     if source_id == target_id:
         msg = "Select a different NPC for the relationship."
         raise ValueError(msg)
-    session = get_session()
     try:
-        source = session.get(NPC, source_id)
-        if source is None:
-            msg = "Save the NPC before adding relationships."
-            raise ValueError(msg)
-        target = session.get(NPC, target_id)
-        if target is None:
-            msg = "Select a valid related NPC."
-            raise ValueError(msg)
-        relation = (
-            session.query(Relationship)
-            .filter(
-                Relationship.npc_id_1 == source.id,
-                Relationship.npc_id_2 == target.id,
+        with get_session() as session, session.begin():
+            found = set(
+                session.scalars(
+                    select(NPC.id).where(NPC.id.in_((source_id, target_id))),
+                ),
             )
-            .one_or_none()
-        )
-        if relation is None:
-            relation = Relationship(
-                npc_id_1=source.id,
-                npc_id_2=target.id,
-                name=relation_name,
+            if source_id not in found:
+                msg = "Save the NPC before adding relationships."
+                raise ValueError(msg)
+            if target_id not in found:
+                msg = "Select a valid related NPC."
+                raise ValueError(msg)
+            _upsert(
+                session,
+                Relationship,
+                ("npc_id_1", "npc_id_2"),
+                {"npc_id_1": source_id, "npc_id_2": target_id, "name": relation_name},
             )
-            session.add(relation)
-        else:
-            relation.name = relation_name
-        session.commit()
     except SQLAlchemyError as exc:
-        session.rollback()
         logger.exception("failed to save relationship", npc_id=source_id)
         msg = "Unable to save the relationship. Check logs for details."
         raise RuntimeError(msg) from exc
-    finally:
-        session.close()
 
 
 def delete_relationship(source_id: int, target_id: int) -> None:
     """Remove a relationship between two NPCs if it exists."""
-    session = get_session()
     try:
-        relation = (
-            session.query(Relationship)
-            .filter(
-                Relationship.npc_id_1 == source_id,
-                Relationship.npc_id_2 == target_id,
+        with get_session() as session, session.begin():
+            session.execute(
+                delete(Relationship).where(
+                    Relationship.npc_id_1 == source_id,
+                    Relationship.npc_id_2 == target_id,
+                ),
             )
-            .one_or_none()
-        )
-        if relation is None:
-            return
-        session.delete(relation)
-        session.commit()
     except SQLAlchemyError as exc:
-        session.rollback()
         logger.exception("failed to delete relationship", npc_id=source_id)
         msg = "Unable to delete the relationship. Check logs for details."
         raise RuntimeError(msg) from exc
-    finally:
-        session.close()
 
 
 def get_types() -> list[str]:
@@ -1487,6 +1580,15 @@ def get_types() -> list[str]:
     return ["NPC", "Location", "Encounter"]
 
 
+def _drop_tables_statement(dialect: Dialect) -> str:
+    """Return one DROP TABLE IF EXISTS statement covering every mapped table."""
+    preparer = dialect.identifier_preparer
+    names = ", ".join(
+        preparer.format_table(table) for table in reversed(Base.metadata.sorted_tables)
+    )
+    return f"DROP TABLE IF EXISTS {names}"
+
+
 def setup_database(
     *,
     rebuild: bool = False,
@@ -1503,14 +1605,15 @@ def setup_database(
                 try:
                     connection.execute(text("SET FOREIGN_KEY_CHECKS=0"))
                     fk_checks_disabled = True
-                    Base.metadata.drop_all(connection)
+                    connection.execute(text(_drop_tables_statement(engine.dialect)))
                 finally:
                     if fk_checks_disabled:
                         connection.execute(text("SET FOREIGN_KEY_CHECKS=1"))
         else:
             Base.metadata.drop_all(engine)
+        clear_faction_caches()
     Base.metadata.create_all(engine)
-    return sessionmaker(bind=engine, expire_on_commit=False)
+    return _get_session_factory()
 
 
 def _quote_mysql_identifier(identifier: str) -> str:
@@ -1526,6 +1629,20 @@ def _drop_database_statement() -> str:
     return f"DROP DATABASE IF EXISTS {quoted};"
 
 
+_ddl_text_cache: dict[Path, tuple[int, str]] = {}
+
+
+def _read_ddl(path: Path) -> str:
+    """Return the stripped DDL text, re-reading the file only after it changes."""
+    mtime_ns = path.stat().st_mtime_ns
+    cached = _ddl_text_cache.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    ddl_sql = path.read_bytes().decode("utf-8").strip()
+    _ddl_text_cache[path] = (mtime_ns, ddl_sql)
+    return ddl_sql
+
+
 def apply_external_schema_with_connector(
     *,
     path: Path | None = None,
@@ -1534,10 +1651,11 @@ def apply_external_schema_with_connector(
     """
     Use mysql-connector-python to execute db.ddl in one pass."""
     ddl_path = path or (PROJECT_ROOT / "data" / "db.ddl")
-    if not ddl_path.exists():
+    try:
+        ddl_sql = _read_ddl(ddl_path)
+    except FileNotFoundError:
         logger.warning("Cannot load DDL; file missing", path=str(ddl_path))
         return
-    ddl_sql = ddl_path.read_text(encoding="utf-8").strip()
     if not ddl_sql:
         logger.info("DDL file is empty; skipping load", path=str(ddl_path))
         return
@@ -1569,8 +1687,17 @@ def apply_external_schema_with_connector(
         try:
             with managed_connection.cursor() as cursor:
                 cursor.execute(ddl_sql)
-                for _, result_set in cursor.fetchsets():
-                    logger.debug("sql statement", results=result_set)
+                # Step through each statement's result without fetching its rows.
+                log_statements = logger.is_enabled_for(LogLevels.DEBUG)
+                while True:
+                    if log_statements:
+                        logger.debug(
+                            "sql statement",
+                            statement=cursor.statement,
+                            rowcount=cursor.rowcount,
+                        )
+                    if not cursor.nextset():
+                        break
             managed_connection.commit()
             logger.info("Applied DDL via mysql-connector", path=str(ddl_path))
         except Exception:
@@ -1582,43 +1709,53 @@ def apply_external_schema_with_connector(
             )
 
 
+# The schema is fixed at import time, so compiled DDL never goes stale.
+_ddl_cache: dict[tuple[str, str], tuple[str, ...]] = {}
+
+
+def _table_ddl(table: Table, dialect: Dialect) -> tuple[str, ...]:
+    """Return the compiled CREATE TABLE and CREATE INDEX statements for a table."""
+    key = (table.name, dialect.name)
+    statements = _ddl_cache.get(key)
+    if statements is None:
+        statements = (
+            str(CreateTable(table).compile(dialect=dialect)),
+            *(
+                str(CreateIndex(index).compile(dialect=dialect))
+                for index in table.indexes
+            ),
+        )
+        _ddl_cache[key] = statements
+    return statements
+
+
 def export_database_ddl(stream: TextIO | None = None) -> None:
     """Write CREATE TABLE/INDEX statements for the schema to a stream."""
     target = stream or sys.stdout
-    engine = connect()
-    table_statements: list[str] = []
-    try:
-        dialect = engine.dialect
-        preparer = dialect.identifier_preparer
-        db_settings = _read_config().get("DB", {})
-        database_name = db_settings.get("database", "final_project")
-        charset = db_settings.get("charset", "utf8mb4")
-        collation = db_settings.get("collation", "utf8mb4_unicode_ci")
-        quoted_db = preparer.quote(database_name)
-
-        for table in Base.metadata.sorted_tables:
-            table_sql = str(CreateTable(table).compile(dialect=dialect))
-            table_statements.append(table_sql)
-            index_statements = [
-                str(CreateIndex(index).compile(dialect=dialect))
-                for index in table.indexes
-            ]
-            table_statements.extend(index_statements)
-    finally:
-        engine.dispose()
-    if not table_statements:
+    # Compiling DDL only needs the dialect; leave the shared engine's pool intact.
+    dialect = connect().dialect
+    preparer = dialect.identifier_preparer
+    db_settings = _read_config().get("DB", {})
+    database_name = db_settings.get("database", "final_project")
+    charset = db_settings.get("charset", "utf8mb4")
+    collation = db_settings.get("collation", "utf8mb4_unicode_ci")
+    quoted_db = preparer.quote(database_name)
+
+    tables = Base.metadata.sorted_tables
+    if not tables:
         target.write("-- No tables defined.\n")
         return
-    statements = [
+    target.write(
         f"CREATE DATABASE IF NOT EXISTS {quoted_db}\n"
         f"    CHARACTER SET {charset}\n"
-        f"    COLLATE {collation}",
-        f"USE {quoted_db}",
-        *table_statements,
-    ]
-    formatted = [f"{statement.rstrip()};" for statement in statements]
-    output = "\n\n".join(formatted) + "\n"
-    target.write(output)
+        f"    COLLATE {collation};\n\n"
+        f"USE {quoted_db};",
+    )
+    # Write each statement as it is produced rather than joining the whole schema.
+    for table in tables:
+        for statement in _table_ddl(table, dialect):
+            target.write(f"\n\n{statement.rstrip()};")
+    target.write("\n")
 
 
 if __name__ == "__main__":
@@ -15,12 +15,15 @@ from final_project.widgets import HtmlPreviewWindow
 with lazi:  # type: ignore[attr-defined]
     import ast
     import json
+    import time
     import tkinter as tk
     from collections.abc import Callable
+    from collections.abc import Container
     from collections.abc import Mapping
     from collections.abc import Sequence
     from contextlib import suppress
     from functools import cache
+    from functools import partial
     from tkinter import messagebox
     from typing import Any
     from typing import Protocol
@@ -32,6 +35,19 @@ with lazi:  # type: ignore[attr-defined]
 
 logger = structlog.getLogger("final_project")
 TRASH_ICON_PATH = PROJECT_ROOT / "data" / "img" / "trashcan.png"
+# About one screen of the settings list; later rows are built after first paint.
+EAGER_SETTING_ROWS = 12
+# Context switches inside this window collapse into one fetch-and-render pass.
+CONTEXT_REFRESH_DELAY_MS = 50
+# NPC options are reused this long unless the main window reports an NPC change.
+TARGET_OPTIONS_TTL_SECONDS = 60.0
+TOAST_DURATION_MS = 1500
+# Border and message colour for inputs that failed form validation.
+ERROR_COLOR = ("#c62828", "#ef5350")
+_BOOL_WORDS = {
+    **dict.fromkeys(("1", "true", "yes", "on"), True),
+    **dict.fromkeys(("0", "false", "no", "off"), False),
+}
 
 try:
     _ICON_RESAMPLE = Image.Resampling.LANCZOS  # type: ignore[attr-defined]
@@ -56,6 +72,9 @@ def _load_trash_bitmap(path: str, height: int) -> Image.Image:
     return image
 
 
+# CTkImage renders scaled photos per widget scaling, so one instance serves
+# every dialog instead of each window wrapping the bitmap again.
+@cache
 def _build_trash_icon(height: int) -> ctk.CTkImage:
     bitmap = _load_trash_bitmap(str(TRASH_ICON_PATH), height)
     return ctk.CTkImage(light_image=bitmap, dark_image=bitmap, size=bitmap.size)
@@ -79,6 +98,67 @@ class SettingGroupSpec:
     fields: tuple[SettingFieldSpec, ...]
 
 
+def _show_toast(parent: tk.Misc, message: str) -> str:
+    """Overlay a short-lived notice on ``parent``; return the dismissal id."""
+    toast = ctk.CTkLabel(
+        parent,
+        text=message,
+        corner_radius=6,
+        fg_color=("gray80", "gray25"),
+    )
+    toast.place(relx=0.5, rely=1.0, y=-16, anchor="s")
+    toast.lift()
+    return parent.after(TOAST_DURATION_MS, toast.destroy)
+
+
+class _InlineErrors:
+    """Outline invalid inputs and explain the problem in a status label."""
+
+    def __init__(self, status_label: ctk.CTkLabel) -> None:
+        """Report validation messages through ``status_label``."""
+        self._status_label = status_label
+        self._flagged: dict[ctk.CTkEntry | ctk.CTkComboBox, Any] = {}
+        self._bound: set[ctk.CTkEntry | ctk.CTkComboBox] = set()
+
+    def show(self, widget: ctk.CTkEntry | ctk.CTkComboBox, message: str) -> None:
+        """Flag ``widget`` with ``message`` and move focus to it."""
+        self.clear()
+        self._flagged[widget] = widget.cget("border_color")
+        widget.configure(border_color=ERROR_COLOR)
+        self._status_label.configure(text=message)
+        if widget not in self._bound:
+            widget.bind("<FocusOut>", lambda _event: self._restore(widget), add="+")
+            self._bound.add(widget)
+        widget.focus_set()
+
+    def clear(self) -> None:
+        """Restore every flagged border and empty the status label."""
+        for widget in list(self._flagged):
+            self._restore(widget)
+        self._status_label.configure(text="")
+
+    def forget(self) -> None:
+        """Drop references to widgets that are about to be destroyed."""
+        self._flagged.clear()
+        self._bound.clear()
+        self._status_label.configure(text="")
+
+    def _restore(self, widget: ctk.CTkEntry | ctk.CTkComboBox) -> None:
+        border_color = self._flagged.pop(widget, None)
+        if border_color is not None:
+            widget.configure(border_color=border_color)
+
+
+@dataclass(slots=True)
+class _SettingsField:
+    """Track a rendered settings entry and the value it was loaded with."""
+
+    entry: ctk.CTkEntry
+    variable: tk.StringVar
+    original: Any
+    label: str
+
+
 @dataclass(frozen=True, slots=True)
 class RelationshipRowSpec:
     """Represent a relationship row ready for rendering."""
@@ -215,6 +295,26 @@ def build_encounter_member_specs(
     )
 
 
+def build_button_row(
+    parent: ctk.CTkFrame | ctk.CTkToplevel,
+    *,
+    on_cancel: Callable[[], None],
+    on_submit: Callable[[], None],
+    submit_text: str,
+) -> tuple[ctk.CTkFrame, ctk.CTkButton]:
+    """Create a right-aligned submit/Cancel row; return it and the submit button."""
+    row = ctk.CTkFrame(parent)
+    row.grid_columnconfigure(0, weight=1)
+    submit_button = ctk.CTkButton(row, text=submit_text, command=on_submit)
+    submit_button.grid(row=0, column=1)
+    ctk.CTkButton(row, text="Cancel", command=on_cancel).grid(
+        row=0,
+        column=2,
+        padx=(0, 10),
+    )
+    return row, submit_button
+
+
 def build_combo_box_state(
     options: Sequence[str] | None,
     current_value: str | None,
@@ -231,6 +331,150 @@ def build_combo_box_state(
     return ComboBoxState(values=normalized_values, selected=selected)
 
 
+@dataclass(slots=True)
+class _TableRow:
+    """Hold the widgets that render one name/detail/delete table row."""
+
+    frame: ctk.CTkFrame
+    name_label: ctk.CTkLabel
+    detail_label: ctk.CTkLabel
+    delete_button: ctk.CTkButton
+
+
+class _RecycledRows:
+    """Render keyed table rows, reusing row widgets across reloads."""
+
+    def __init__(
+        self,
+        parent: ctk.CTkScrollableFrame,
+        *,
+        empty_text: str,
+        icon: ctk.CTkImage,
+        on_delete: Callable[[int], None],
+        detail_wraplength: int = 0,
+    ) -> None:
+        """Bind the row list to its scrollable container."""
+        self._parent = parent
+        self._empty_text = empty_text
+        self._icon = icon
+        self._on_delete = on_delete
+        self._detail_wraplength = detail_wraplength
+        self._rows: dict[int, _TableRow] = {}
+        self._rendered: dict[int, tuple[str, str]] = {}
+        self._order: list[int] = []
+        self._spare: list[_TableRow] = []
+        self._empty_label: ctk.CTkLabel | None = None
+
+    def render(self, entries: Sequence[tuple[int, str, str]]) -> None:
+        """Show (key, name, detail) entries, touching only rows that changed."""
+        wanted = {entry[0] for entry in entries}
+        for key in self._rows.keys() - wanted:
+            removed = self._rows.pop(key)
+            del self._rendered[key]
+            removed.frame.pack_forget()
+            # Removed rows stay hidden in a spare pool for the next added key.
+            self._spare.append(removed)
+        self._toggle_empty_label(show=not entries)
+        # Keys in their on-screen pack order; only rows out of place are re-packed.
+        packed = [key for key in self._order if key in wanted]
+        for index, (key, name, detail) in enumerate(entries):
+            row = self._rows.get(key)
+            if row is None:
+                row = self._spare.pop() if self._spare else self._create_row()
+                row.delete_button.configure(command=partial(self._on_delete, key))
+                self._rows[key] = row
+            if self._rendered.get(key) != (name, detail):
+                row.name_label.configure(text=name)
+                row.detail_label.configure(text=detail)
+                self._rendered[key] = (name, detail)
+            if index < len(packed) and packed[index] == key:
+                continue
+            if key in packed:
+                packed.remove(key)
+            placement: dict[str, ctk.CTkFrame] = {}
+            if index:
+                placement["after"] = self._rows[entries[index - 1][0]].frame
+            elif packed:
+                placement["before"] = self._rows[packed[0]].frame
+            row.frame.pack(fill="x", padx=5, pady=2, **placement)
+            packed.insert(index, key)
+        self._order = [entry[0] for entry in entries]
+
+    def _toggle_empty_label(self, *, show: bool) -> None:
+        if not show:
+            if self._empty_label is not None:
+                self._empty_label.pack_forget()
+            return
+        if self._empty_label is None:
+            self._empty_label = ctk.CTkLabel(
+                self._parent,
+                text=self._empty_text,
+                anchor="w",
+            )
+        self._empty_label.pack(fill="x", padx=5, pady=5)
+
+    def _create_row(self) -> _TableRow:
+        frame = ctk.CTkFrame(self._parent, fg_color="transparent")
+        name_label = ctk.CTkLabel(frame, text="", anchor="w")
+        name_label.pack(side="left", expand=True, fill="x")
+        detail_label = ctk.CTkLabel(
+            frame,
+            text="",
+            anchor="w",
+            wraplength=self._detail_wraplength,
+        )
+        detail_label.pack(side="left", expand=True, fill="x")
+        delete_button = ctk.CTkButton(frame, text="", width=36, image=self._icon)
+        delete_button.pack(side="left", padx=(5, 0))
+        return _TableRow(frame, name_label, detail_label, delete_button)
+
+
+class _NpcOptionsCache:
+    """Keep one campaign's NPC options so dialog reloads can skip the query."""
+
+    def __init__(self) -> None:
+        """Start with nothing cached."""
+        self._campaign: str | None = None
+        self._options: tuple[NpcOption, ...] = ()
+        self._labels: tuple[str, ...] = ()
+        self._loaded_at: float | None = None
+
+    def labelled(
+        self,
+        manager: DialogManager,
+        campaign: str | None,
+        exclude: Container[int],
+    ) -> list[tuple[str, int]]:
+        """Return (combo label, identifier) pairs for the non-excluded options."""
+        self._load(manager, campaign)
+        # Exclusions are applied here so add/remove cycles reuse the same fetch.
+        return [
+            (label, option.identifier)
+            for option, label in zip(self._options, self._labels, strict=True)
+            if option.identifier not in exclude
+        ]
+
+    def _load(self, manager: DialogManager, campaign: str | None) -> None:
+        now = time.monotonic()
+        if (
+            self._loaded_at is not None
+            and campaign == self._campaign
+            and now - self._loaded_at < TARGET_OPTIONS_TTL_SECONDS
+        ):
+            return
+        self._options = tuple(manager.relationship_targets_for_campaign(campaign))
+        # Labels are formatted once per fetch rather than on every refresh.
+        self._labels = tuple(
+            format_npc_option_label(option) for option in self._options
+        )
+        self._campaign = campaign
+        self._loaded_at = now
+
+    def invalidate(self) -> None:
+        """Force the next lookup to query the manager again."""
+        self._loaded_at = None
+
+
 @runtime_checkable
 class DialogManager(Protocol):
     """Structural contract expected from the main GUI window."""
@@ -369,7 +613,13 @@ class SettingsDialog(ctk.CTkToplevel):  # type: ignore[misc]
         self.transient(master)
         self._on_settings_saved = on_settings_saved
         self._on_close = on_close
-        self._fields: dict[tuple[str, str], tuple[ctk.CTkEntry, Any]] = {}
+        self._fields: dict[tuple[str, str], _SettingsField] = {}
+        self._pending_rows: list[
+            tuple[ctk.CTkFrame, SettingGroupSpec, SettingFieldSpec]
+        ] = []
+        self._pending_after_id: str | None = None
+        self._confirm_frame: ctk.CTkFrame | None = None
+        self._confirm_action: Callable[[], None] | None = None
         self._settings_snapshot = settings_manager.get_settings_snapshot()
 
         self._build_widgets()
@@ -379,7 +629,6 @@ class SettingsDialog(ctk.CTkToplevel):  # type: ignore[misc]
 
     def _build_widgets(self) -> None:
         heading_font = ctk.CTkFont(size=18, weight="bold")
-        group_font = ctk.CTkFont(size=14, weight="bold")
         ctk.CTkLabel(
             self,
             text="Application Settings",
@@ -389,7 +638,38 @@ class SettingsDialog(ctk.CTkToplevel):  # type: ignore[misc]
 
         self._scroll_frame = ctk.CTkScrollableFrame(self, height=360, width=460)
         self._scroll_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        self._build_form()
+
+        actions = ctk.CTkFrame(self)
+        actions.pack(fill="x", padx=20, pady=(0, 20))
+        status_label = ctk.CTkLabel(
+            actions,
+            text="",
+            text_color=ERROR_COLOR,
+            anchor="w",
+        )
+        status_label.pack(side="top", fill="x", padx=5)
+        self._errors = _InlineErrors(status_label)
+        reset_btn = ctk.CTkButton(
+            actions,
+            text="Reset to Defaults",
+            command=self._handle_reset_defaults,
+        )
+        reset_btn.pack(side="left")
+        cancel_btn = ctk.CTkButton(actions, text="Cancel", command=self._handle_cancel)
+        cancel_btn.pack(side="right", padx=(10, 0))
+        self._save_btn = ctk.CTkButton(
+            actions,
+            text="Save",
+            command=self._handle_save,
+            state=self._save_button_state(),
+        )
+        self._save_btn.pack(side="right")
+
+    def _build_form(self) -> None:
+        group_font = ctk.CTkFont(size=14, weight="bold")
         group_specs = build_settings_group_specs(self._settings_snapshot)
+        pending: list[tuple[ctk.CTkFrame, SettingGroupSpec, SettingFieldSpec]] = []
         if not group_specs:
             ctk.CTkLabel(
                 self._scroll_frame,
@@ -406,52 +686,89 @@ class SettingsDialog(ctk.CTkToplevel):  # type: ignore[misc]
                     font=group_font,
                     anchor="w",
                 ).pack(fill="x", pady=(0, 6))
-                for field in group.fields:
-                    value = field.original_value
-                    row = ctk.CTkFrame(section, fg_color="transparent")
-                    row.pack(fill="x", pady=(0, 6))
-                    ctk.CTkLabel(
-                        row,
-                        text=field.label,
-                        width=190,
-                        anchor="w",
-                    ).pack(side="left")
-                    entry = ctk.CTkEntry(row)
-                    entry.insert(0, self._stringify_value(value))
-                    entry.pack(side="left", fill="x", expand=True, padx=(10, 0))
-                    self._fields[(group.key, field.key)] = (entry, value)
+                pending.extend((section, group, field) for field in group.fields)
+            for section, group, field in pending[:EAGER_SETTING_ROWS]:
+                self._build_field_row(section, group, field)
+            self._pending_rows = pending[EAGER_SETTING_ROWS:]
+            if self._pending_rows:
+                self._pending_after_id = self.after_idle(self._build_pending_rows)
+
+    def _save_button_state(self) -> str:
+        return "normal" if self._fields or self._pending_rows else "disabled"
+
+    def show(self) -> None:
+        """
+        Re-open the hidden dialog with the stored settings.
+
+        The form is only rebuilt when the settings on disk no longer match it;
+        otherwise unsaved edits from the last visit are discarded in place.
+        """
+        self._errors.clear()
+        snapshot = settings_manager.get_settings_snapshot()
+        if snapshot != self._settings_snapshot:
+            self._settings_snapshot = snapshot
+            self._rebuild_form()
+        else:
+            for field in self._fields.values():
+                self._restore_original(field)
+        self.deiconify()
+        self.grab_set()
 
-        actions = ctk.CTkFrame(self)
-        actions.pack(fill="x", padx=20, pady=(0, 20))
-        reset_btn = ctk.CTkButton(
-            actions,
-            text="Reset to Defaults",
-            command=self._handle_reset_defaults,
-        )
-        reset_btn.pack(side="left")
-        cancel_btn = ctk.CTkButton(actions, text="Cancel", command=self._handle_cancel)
-        cancel_btn.pack(side="right", padx=(10, 0))
-        self._save_btn = ctk.CTkButton(
-            actions,
-            text="Save",
-            command=self._handle_save,
-            state="normal" if self._fields else "disabled",
+    def _rebuild_form(self) -> None:
+        if self._pending_after_id is not None:
+            self.after_cancel(self._pending_after_id)
+            self._pending_after_id = None
+        self._pending_rows = []
+        self._fields.clear()
+        self._errors.forget()
+        for child in self._scroll_frame.winfo_children():
+            child.destroy()
+        self._build_form()
+        self._save_btn.configure(state=self._save_button_state())
+
+    def _build_field_row(
+        self,
+        section: ctk.CTkFrame,
+        group: SettingGroupSpec,
+        field: SettingFieldSpec,
+    ) -> None:
+        value = field.original_value
+        row = ctk.CTkFrame(section, fg_color="transparent")
+        row.pack(fill="x", pady=(0, 6))
+        ctk.CTkLabel(
+            row,
+            text=field.label,
+            width=190,
+            anchor="w",
+        ).pack(side="left")
+        variable = tk.StringVar(self, value=self._stringify_value(value))
+        entry = ctk.CTkEntry(row, textvariable=variable)
+        entry.pack(side="left", fill="x", expand=True, padx=(10, 0))
+        self._fields[(group.key, field.key)] = _SettingsField(
+            entry=entry,
+            variable=variable,
+            original=value,
+            label=f"{group.label} / {field.label}",
         )
-        self._save_btn.pack(side="right")
+
+    def _build_pending_rows(self) -> None:
+        if self._pending_after_id is not None:
+            self.after_cancel(self._pending_after_id)
+            self._pending_after_id = None
+        pending, self._pending_rows = self._pending_rows, []
+        for section, group, field in pending:
+            self._build_field_row(section, group, field)
 
     def _handle_save(self) -> None:
+        self._build_pending_rows()
+        self._errors.clear()
         updated_settings = settings_manager.get_settings_snapshot()
-        for (group, key), (entry, original) in self._fields.items():
-            display_name = (
-                f"{format_settings_group_name(group)} / "
-                f"{format_settings_key_label(key)}"
-            )
+        for (group, key), field in self._fields.items():
             try:
-                parsed_value = self._convert_value(entry.get(), original)
+                parsed_value = self._convert_value(field.entry.get(), field.original)
             except ValueError as exc:
-                messagebox.showerror("Settings", f"{display_name}: {exc}")
-                entry.focus_set()
-                entry.select_range(0, tk.END)
+                self._errors.show(field.entry, f"{field.label}: {exc}")
+                field.entry.select_range(0, tk.END)
                 return
             bucket = updated_settings.setdefault(group, {})
             bucket[key] = parsed_value
@@ -466,22 +783,62 @@ class SettingsDialog(ctk.CTkToplevel):  # type: ignore[misc]
             return
         if self._on_settings_saved is not None:
             self._on_settings_saved(saved)
-        messagebox.showinfo("Settings", "Settings saved successfully.")
+        _show_toast(self.master, "Settings saved successfully.")
         self._close()
 
     def _handle_cancel(self) -> None:
         self._close()
 
     def _handle_reset_defaults(self) -> None:
-        if not messagebox.askyesno(
-            "Settings",
+        self._show_inline_confirm(
             (
                 "Reset all settings to their defaults?\n\n"
                 "This will remove your custom settings file."
             ),
-            icon="warning",
-        ):
-            return
+            self._reset_defaults,
+        )
+
+    def _show_inline_confirm(self, message: str, on_yes: Callable[[], None]) -> None:
+        """Cover the form with a Yes/No prompt instead of a native message box."""
+        if self._confirm_frame is None:
+            self._confirm_frame = ctk.CTkFrame(self, corner_radius=0)
+            panel = ctk.CTkFrame(self._confirm_frame)
+            panel.place(relx=0.5, rely=0.5, anchor="center")
+            self._confirm_label = ctk.CTkLabel(panel, text="", wraplength=380)
+            self._confirm_label.pack(padx=20, pady=(20, 10))
+            buttons = ctk.CTkFrame(panel, fg_color="transparent")
+            buttons.pack(padx=20, pady=(0, 20))
+            self._confirm_yes_button = ctk.CTkButton(
+                buttons,
+                text="Yes",
+                width=90,
+                command=self._accept_confirm,
+            )
+            self._confirm_yes_button.pack(side="left", padx=(0, 10))
+            ctk.CTkButton(
+                buttons,
+                text="No",
+                width=90,
+                command=self._dismiss_confirm,
+            ).pack(side="left")
+        self._confirm_action = on_yes
+        self._confirm_label.configure(text=message)
+        self._confirm_frame.place(relx=0, rely=0, relwidth=1, relheight=1)
+        self._confirm_frame.lift()
+
+    def _accept_confirm(self) -> None:
+        action = self._confirm_action
+        self._dismiss_confirm()
+        if action is not None:
+            action()
+
+    def _dismiss_confirm(self) -> None:
+        self._confirm_action = None
+        if self._confirm_frame is not None:
+            self._confirm_frame.place_forget()
+
+    def _reset_defaults(self) -> None:
+        self._errors.clear()
         try:
             defaults = settings_manager.reset_user_settings_to_defaults()
         except OSError as exc:
@@ -492,29 +849,26 @@ class SettingsDialog(ctk.CTkToplevel):  # type: ignore[misc]
             )
             return
         self._settings_snapshot = defaults
-        for key, (entry, _original) in self._fields.items():
-            group, setting = key
-            updated_value = defaults.get(group, {}).get(setting)
-            entry.delete(0, tk.END)
-            if updated_value is not None:
-                entry.insert(0, self._stringify_value(updated_value))
-            self._fields[key] = (entry, updated_value)
-        messagebox.showinfo("Settings", "Settings reset to defaults.")
+        self._build_pending_rows()
+        for (group, setting), field in self._fields.items():
+            field.original = defaults.get(group, {}).get(setting)
+            self._restore_original(field)
+        _show_toast(self, "Settings reset to defaults.")
+
+    def _restore_original(self, field: _SettingsField) -> None:
+        original = field.original
+        field.variable.set("" if original is None else self._stringify_value(original))
 
     def _close(self) -> None:
+        # Hide rather than destroy so the next show() can reuse the widgets.
         if not self.winfo_exists():
             return
+        self._dismiss_confirm()
         with suppress(tk.TclError):
             self.grab_release()
         if self._on_close is not None:
             self._on_close(self)
-        self.destroy()
-
-    def _format_group_name(self, name: str) -> str:
-        return name.replace("_", " ")
-
-    def _format_key_label(self, key: str) -> str:
-        return key.replace("_", " ").capitalize()
+        self.withdraw()
 
     def _stringify_value(self, value: Any) -> str:
         if isinstance(value, bool):
@@ -546,13 +900,11 @@ class SettingsDialog(ctk.CTkToplevel):  # type: ignore[misc]
         return result
 
     def _parse_bool(self, text: str) -> bool:
-        lowered = text.lower()
-        if lowered in {"1", "true", "yes", "on"}:
-            return True
-        if lowered in {"0", "false", "no", "off"}:
-            return False
-        msg = "enter true or false"
-        raise ValueError(msg)
+        parsed = _BOOL_WORDS.get(text.casefold())
+        if parsed is None:
+            msg = "enter true or false"
+            raise ValueError(msg)
+        return parsed
 
     def _parse_int(self, text: str) -> int:
         if text == "":
@@ -567,6 +919,9 @@ class SettingsDialog(ctk.CTkToplevel):  # type: ignore[misc]
         return float(text)
 
     def _parse_literal(self, raw_value: str, *, default: Any | None = None) -> Any:
+        # _stringify_value writes JSON, so most edits parse without compiling source.
+        with suppress(json.JSONDecodeError):
+            return json.loads(raw_value)
         try:
             return ast.literal_eval(raw_value)
         except (ValueError, SyntaxError) as exc:
@@ -593,12 +948,16 @@ class RelationshipDialog(ctk.CTkToplevel):  # type: ignore[misc]
         self.source_name = source_name
         self.campaign = campaign
         self._target_option_map: dict[str, int] = {}
+        self._target_options = _NpcOptionsCache()
+        self._target_values: tuple[str, ...] = ()
         self._delete_icon = _build_trash_icon(16)
+        self._refresh_after_id: str | None = None
 
         self.title("Relationships")
         self._build_layout()
         self.protocol("WM_DELETE_WINDOW", self._handle_close)
         self.update_context(source_id, source_name, campaign)
+        self._refresh_contents()
         self.grab_set()
 
     def _build_layout(self) -> None:
@@ -631,6 +990,12 @@ class RelationshipDialog(ctk.CTkToplevel):  # type: ignore[misc]
 
         self._rows_frame = ctk.CTkScrollableFrame(table_frame, height=240)
         self._rows_frame.pack(fill="both", expand=True)
+        self._row_list = _RecycledRows(
+            self._rows_frame,
+            empty_text="No relationships recorded.",
+            icon=self._delete_icon,
+            on_delete=self._handle_delete,
+        )
 
         controls = ctk.CTkFrame(self)
         controls.pack(fill="x", pady=(10, 0))
@@ -647,84 +1012,83 @@ class RelationshipDialog(ctk.CTkToplevel):  # type: ignore[misc]
         add_btn = ctk.CTkButton(controls, text="Add", command=self._handle_add)
         add_btn.pack(side="left")
 
+        status_label = ctk.CTkLabel(self, text="", text_color=ERROR_COLOR, anchor="w")
+        status_label.pack(fill="x", pady=(5, 0))
+        self._errors = _InlineErrors(status_label)
+
     def update_context(
         self,
         source_id: int,
         source_name: str,
         campaign: str | None,
     ) -> None:
-        """Refresh the dialog contents for a different NPC or campaign."""
+        """Point the dialog at another NPC, coalescing rapid switches."""
         self.source_id = source_id
         self.source_name = source_name
         self.campaign = campaign
         self._header_label.configure(text=f"Relationships - {source_name}")
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.after(
+            CONTEXT_REFRESH_DELAY_MS,
+            self._refresh_contents,
+        )
+
+    def _refresh_contents(self) -> None:
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
+        if not self.winfo_exists():
+            return
         self._refresh_target_options()
         self._reload_rows()
 
+    def invalidate_targets_cache(self) -> None:
+        """Drop cached NPC options after NPCs change elsewhere in the app."""
+        self._target_options.invalidate()
+
     def _refresh_target_options(self) -> None:
-        options = self.manager.relationship_targets_for_campaign(
+        labelled = self._target_options.labelled(
+            self.manager,
             self.campaign,
-            exclude=(self.source_id,),
+            exclude={self.source_id},
         )
         option_labels: list[str] = []
         self._target_option_map.clear()
-        for option in options:
-            label = format_npc_option_label(option)
-            self._target_option_map[label] = option.identifier
+        for label, identifier in labelled:
+            self._target_option_map[label] = identifier
             option_labels.append(label)
         combo_state = build_combo_box_state(option_labels, self._target_combo.get())
-        self._target_combo.configure(values=combo_state.values)
+        # Reconfiguring values redraws the dropdown even when nothing changed.
+        if combo_state.values != self._target_values:
+            self._target_values = combo_state.values
+            self._target_combo.configure(values=combo_state.values)
         self._target_combo.set(combo_state.selected)
 
     def _reload_rows(self) -> None:
-        for child in self._rows_frame.winfo_children():
-            child.destroy()
         row_specs = build_relationship_row_specs(
             self.manager.fetch_relationship_rows(self.source_id),
         )
-        if not row_specs:
-            ctk.CTkLabel(
-                self._rows_frame,
-                text="No relationships recorded.",
-                anchor="w",
-            ).pack(fill="x", padx=5, pady=5)
-            return
-        for spec in row_specs:
-            row = ctk.CTkFrame(self._rows_frame, fg_color="transparent")
-            row.pack(fill="x", padx=5, pady=2)
-            ctk.CTkLabel(row, text=spec.target_name, anchor="w").pack(
-                side="left",
-                expand=True,
-                fill="x",
-            )
-            ctk.CTkLabel(row, text=spec.relation_name, anchor="w").pack(
-                side="left",
-                expand=True,
-                fill="x",
-            )
-            delete_btn = ctk.CTkButton(
-                row,
-                text="",
-                width=36,
-                image=self._delete_icon,
-                command=lambda target_id=spec.target_id: self._handle_delete(
-                    target_id,
-                ),
-            )
-            delete_btn.pack(side="left", padx=(5, 0))
+        self._row_list.render(
+            [
+                (spec.target_id, spec.target_name, spec.relation_name)
+                for spec in row_specs
+            ],
+        )
 
     def _handle_add(self) -> None:
         target_label = self._target_combo.get().strip()
         relation_name = self._type_entry.get().strip()
+        self._errors.clear()
         if not target_label:
-            messagebox.showerror("Relationships", "Select an NPC to relate to.")
+            self._errors.show(self._target_combo, "Select an NPC to relate to.")
             return
         if not relation_name:
-            messagebox.showerror("Relationships", "Enter a relationship type.")
+            self._errors.show(self._type_entry, "Enter a relationship type.")
             return
         target_id = self._target_option_map.get(target_label)
         if target_id is None:
-            messagebox.showerror("Relationships", "Select a valid NPC to relate to.")
+            self._errors.show(self._target_combo, "Select a valid NPC to relate to.")
             return
         try:
             self.manager.upsert_relationship(
@@ -752,6 +1116,8 @@ class RelationshipDialog(ctk.CTkToplevel):  # type: ignore[misc]
         self._reload_rows()
 
     def _handle_close(self) -> None:
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
         self.manager.on_relationship_dialog_close(self)
         self.destroy()
 
@@ -772,6 +1138,9 @@ class EncounterMembersDialog(ctk.CTkToplevel):  # type: ignore[misc]
         self.campaign = campaign
         self._current_members: set[int] = set()
         self._npc_option_map: dict[str, int] = {}
+        self._npc_options = _NpcOptionsCache()
+        self._npc_values: tuple[str, ...] = ()
+        self._refresh_after_id: str | None = None
 
         self._delete_icon = _build_trash_icon(16)
 
@@ -783,6 +1152,7 @@ class EncounterMembersDialog(ctk.CTkToplevel):  # type: ignore[misc]
         self._build_layout()
         self.protocol("WM_DELETE_WINDOW", self._handle_close)
         self.update_context(encounter_id, campaign)
+        self._refresh_contents()
         self.grab_set()
 
     def _build_layout(self) -> None:
@@ -815,6 +1185,13 @@ class EncounterMembersDialog(ctk.CTkToplevel):  # type: ignore[misc]
 
         self._rows_frame = ctk.CTkScrollableFrame(table_frame, height=240)
         self._rows_frame.pack(fill="both", expand=True)
+        self._row_list = _RecycledRows(
+            self._rows_frame,
+            empty_text="No participants assigned to this encounter.",
+            icon=self._delete_icon,
+            on_delete=self._handle_remove,
+            detail_wraplength=260,
+        )
 
         controls = ctk.CTkFrame(self)
         controls.pack(fill="x", pady=(10, 0))
@@ -829,7 +1206,7 @@ class EncounterMembersDialog(ctk.CTkToplevel):  # type: ignore[misc]
         add_btn.pack(side="left")
 
     def update_context(self, encounter_id: int, campaign: str | None) -> None:
-        """Refresh available NPCs and member rows for the encounter."""
+        """Point the dialog at another encounter, coalescing rapid switches."""
         self.encounter_id = encounter_id
         self.campaign = campaign
         if encounter_id:
@@ -837,59 +1214,51 @@ class EncounterMembersDialog(ctk.CTkToplevel):  # type: ignore[misc]
         else:
             header = "Encounter Members (unsaved)"
         self._header_label.configure(text=header)
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.after(
+            CONTEXT_REFRESH_DELAY_MS,
+            self._refresh_contents,
+        )
+
+    def _refresh_contents(self) -> None:
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
+        if not self.winfo_exists():
+            return
         self._reload_rows()
         self._refresh_npc_options()
 
+    def invalidate_targets_cache(self) -> None:
+        """Drop cached NPC options after NPCs change elsewhere in the app."""
+        self._npc_options.invalidate()
+
     def _refresh_npc_options(self) -> None:
-        options = self.manager.relationship_targets_for_campaign(
+        labelled = self._npc_options.labelled(
+            self.manager,
             self.campaign,
-            exclude=tuple(self._current_members),
+            exclude=self._current_members,
         )
         option_labels: list[str] = []
         self._npc_option_map.clear()
-        for option in options:
-            label = format_npc_option_label(option)
-            self._npc_option_map[label] = option.identifier
+        for label, identifier in labelled:
+            self._npc_option_map[label] = identifier
             option_labels.append(label)
         combo_state = build_combo_box_state(option_labels, self._npc_combo.get())
-        self._npc_combo.configure(values=combo_state.values)
+        if combo_state.values != self._npc_values:
+            self._npc_values = combo_state.values
+            self._npc_combo.configure(values=combo_state.values)
         self._npc_combo.set(combo_state.selected)
 
     def _reload_rows(self) -> None:
-        for child in self._rows_frame.winfo_children():
-            child.destroy()
         row_specs = build_encounter_member_specs(
             self.manager.fetch_encounter_members(self.encounter_id),
         )
         self._current_members = {spec.npc_id for spec in row_specs}
-        if not row_specs:
-            ctk.CTkLabel(
-                self._rows_frame,
-                text="No participants assigned to this encounter.",
-                anchor="w",
-            ).pack(fill="x", padx=5, pady=5)
-            return
-        for spec in row_specs:
-            row = ctk.CTkFrame(self._rows_frame, fg_color="transparent")
-            row.pack(fill="x", padx=5, pady=2)
-            ctk.CTkLabel(row, text=spec.npc_name, anchor="w").pack(
-                side="left",
-                expand=True,
-                fill="x",
-            )
-            ctk.CTkLabel(row, text=spec.notes, anchor="w", wraplength=260).pack(
-                side="left",
-                expand=True,
-                fill="x",
-            )
-            delete_btn = ctk.CTkButton(
-                row,
-                text="",
-                width=36,
-                image=self._delete_icon,
-                command=lambda npc_id=spec.npc_id: self._handle_remove(npc_id),
-            )
-            delete_btn.pack(side="left", padx=(5, 0))
+        self._row_list.render(
+            [(spec.npc_id, spec.npc_name, spec.notes) for spec in row_specs],
+        )
 
     def _handle_add(self) -> None:
         npc_label = self._npc_combo.get().strip()
@@ -925,6 +1294,8 @@ class EncounterMembersDialog(ctk.CTkToplevel):  # type: ignore[misc]
         self._refresh_npc_options()
 
     def _handle_close(self) -> None:
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
         self.manager.on_encounter_members_dialog_close(self)
         self.destroy()
 
@@ -967,9 +1338,9 @@ class FactionDialog(ctk.CTkToplevel):  # type: ignore[misc]
         form.pack(fill="both", expand=True, padx=20, pady=10)
 
         ctk.CTkLabel(form, text="Faction Name:").pack(anchor="w")
-        self._name_entry = ctk.CTkEntry(form)
+        self._name_var = tk.StringVar(self, value=initial_name)
+        self._name_entry = ctk.CTkEntry(form, textvariable=self._name_var)
         self._name_entry.pack(fill="x", pady=(0, 10))
-        self._name_entry.insert(0, initial_name)
         self._allow_name_edit = allow_name_edit
         if not allow_name_edit:
             self._name_entry.configure(state="disabled")
@@ -986,36 +1357,68 @@ class FactionDialog(ctk.CTkToplevel):  # type: ignore[misc]
         if initial_notes:
             self._notes.insert("1.0", initial_notes)
 
-        buttons = ctk.CTkFrame(self)
-        buttons.pack(fill="x", padx=20, pady=(0, 20))
-        ctk.CTkButton(buttons, text="Cancel", command=self._handle_cancel).pack(
-            side="right",
-            padx=(0, 10),
-        )
-        self._save_btn = ctk.CTkButton(
-            buttons,
-            text=save_button_label,
-            command=self._handle_submit,
+        status_label = ctk.CTkLabel(self, text="", text_color=ERROR_COLOR, anchor="w")
+        status_label.pack(fill="x", padx=20)
+        self._errors = _InlineErrors(status_label)
+
+        buttons, self._save_btn = build_button_row(
+            self,
+            on_cancel=self._handle_cancel,
+            on_submit=self._handle_submit,
+            submit_text=save_button_label,
         )
-        self._save_btn.pack(side="right")
+        buttons.pack(fill="x", padx=20, pady=(0, 20))
 
         self.bind("<Return>", lambda event: self._handle_submit())  # noqa: ARG005
         self.protocol("WM_DELETE_WINDOW", self._handle_cancel)
 
     def _handle_submit(self) -> None:
-        name = self._name_entry.get().strip()
+        name = self._name_var.get().strip()
         description = self._description.get("1.0", tk.END).strip()
         notes = self._notes.get("1.0", tk.END).strip()
         if not name:
-            messagebox.showerror("Faction", "Enter a faction name.")
+            self._errors.show(self._name_entry, "Enter a faction name.")
             return
+        self._errors.clear()
         self._on_submit(name, description, notes)
-        self.destroy()
+        self._hide()
 
     def _handle_cancel(self) -> None:
         if self._on_cancel is not None:
             self._on_cancel()
-        self.destroy()
+        self._hide()
+
+    def _hide(self) -> None:
+        # The manager reopens this instance through show() instead of rebuilding it.
+        with suppress(tk.TclError):
+            self.grab_release()
+        self.withdraw()
+
+    def show(
+        self,
+        initial_name: str,
+        campaign: str,
+        on_submit: Callable[[str, str, str], None],
+        on_cancel: Callable[[], None] | None = None,
+        *,
+        dialog_options: dict[str, Any] | None = None,
+    ) -> None:
+        """Reset a hidden dialog for a new faction prompt and display it."""
+        self._on_submit = on_submit
+        self._on_cancel = on_cancel
+        self._errors.clear()
+        self.update_context(
+            initial_name,
+            campaign,
+            dialog_options={
+                "dialog_title": "New Faction",
+                "save_button_label": "Save",
+                "allow_name_edit": True,
+                **(dialog_options or {}),
+            },
+        )
+        self.deiconify()
+        self.grab_set()
 
     def update_context(
         self,
@@ -1040,11 +1443,11 @@ class FactionDialog(ctk.CTkToplevel):  # type: ignore[misc]
             self._allow_name_edit if allow_name_edit is None else bool(allow_name_edit)
         )
         self._allow_name_edit = effective_allow_edit
-        self._name_entry.configure(state="normal")
-        self._name_entry.delete(0, tk.END)
-        self._name_entry.insert(0, initial_name)
-        if not effective_allow_edit:
-            self._name_entry.configure(state="disabled")
+        # The variable updates the entry even while it is disabled.
+        self._name_var.set(initial_name)
+        self._name_entry.configure(
+            state="normal" if effective_allow_edit else "disabled",
+        )
 
         self._description.delete("1.0", tk.END)
         if initial_description:
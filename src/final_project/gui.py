@@ -982,6 +982,14 @@ class TTRPGDataManager(ctk.CTk):  # type: ignore[misc]
         """Clear encounter dialog ref when closed."""
         self._encounter_dialogs.clear(dialog)
 
+    def _invalidate_npc_options(self) -> None:
+        relationship_dialog = self._relationship_dialogs.current_dialog()
+        if relationship_dialog is not None and relationship_dialog.winfo_exists():
+            relationship_dialog.invalidate_targets_cache()
+        encounter_dialog = self._encounter_dialogs.current_dialog()
+        if encounter_dialog is not None and encounter_dialog.winfo_exists():
+            encounter_dialog.invalidate_targets_cache()
+
     def _relationship_dialog_context(
         self,
         *,
@@ -1075,29 +1083,12 @@ class TTRPGDataManager(ctk.CTk):  # type: ignore[misc]
         self,
         context: FactionDialogContext,
     ) -> FactionDialog:
-        def _wrapped_submit(name: str, description: str, notes: str) -> None:
-            try:
-                context.on_submit(name, description, notes)
-            finally:
-                dialog_ref = self._faction_dialogs.current_dialog()
-                if dialog_ref is not None:
-                    self._faction_dialogs.clear(dialog_ref)
-
-        def _wrapped_cancel() -> None:
-            try:
-                if context.on_cancel is not None:
-                    context.on_cancel()
-            finally:
-                dialog_ref = self._faction_dialogs.current_dialog()
-                if dialog_ref is not None:
-                    self._faction_dialogs.clear(dialog_ref)
-
         return FactionDialog(
             self,
             context.initial_name,
             context.campaign,
-            _wrapped_submit,
-            _wrapped_cancel,
+            context.on_submit,
+            context.on_cancel,
             **context.dialog_options,
         )
 
@@ -1106,9 +1097,11 @@ class TTRPGDataManager(ctk.CTk):  # type: ignore[misc]
         dialog: FactionDialog,
         context: FactionDialogContext,
     ) -> None:
-        dialog.update_context(
+        dialog.show(
             context.initial_name,
             context.campaign,
+            context.on_submit,
+            context.on_cancel,
             dialog_options=context.dialog_options,
         )
         dialog.lift()
@@ -1152,16 +1145,13 @@ class TTRPGDataManager(ctk.CTk):  # type: ignore[misc]
         return window_ref
 
     def _build_settings_dialog(self, _: bool) -> SettingsDialog:
-        def _handle_close(dialog: SettingsDialog) -> None:
-            self._settings_dialogs.clear(dialog)
-
         return SettingsDialog(
             self,
             on_settings_saved=self._handle_settings_saved,
-            on_close=_handle_close,
         )
 
     def _update_settings_dialog(self, dialog: SettingsDialog, _: bool) -> None:
+        dialog.show()
         dialog.lift()
         dialog.focus_force()
 
@@ -1319,6 +1309,7 @@ class TTRPGDataManager(ctk.CTk):  # type: ignore[misc]
         self._pending_changes.pop(key, None)
         self._pending_images.pop(key, None)
         self._pending_faction_changes.pop(key, None)
+        self._invalidate_npc_options()
         handled = self._show_next_result_after_delete(normalized, identifier)
         if not handled:
             self.clear_form()
@@ -1682,6 +1673,8 @@ class TTRPGDataManager(ctk.CTk):  # type: ignore[misc]
                 )
                 return
             updated = result.updated
+            if updated:
+                self._invalidate_npc_options()
             for key in result.applied_keys:
                 self._pending_changes.pop(key, None)
                 self._pending_images.pop(key, None)
@@ -1811,6 +1804,7 @@ class TTRPGDataManager(ctk.CTk):  # type: ignore[misc]
             messagebox.showerror("New", error_msg)
             return
 
+        self._invalidate_npc_options()
         self._clear_results()
         record_key = self._record_key_from_instance(entry_type, created_instance)
         self._current_record_key = record_key
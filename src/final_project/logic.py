@@ -19,6 +19,7 @@ from final_project.db import ImageStore
 from final_project.db import Location
 from final_project.db import NPC
 from final_project.db import assign_faction_member
+from final_project.db import clear_faction_caches
 from final_project.db import clear_faction_membership as db_clear_faction_membership
 from final_project.db import core_tables_empty
 from final_project.db import delete_encounter_participant
@@ -324,6 +325,8 @@ class DataLogic:
             session.rollback()
             raise
         else:
+            # Deleting an NPC cascades to its faction membership.
+            clear_faction_caches()
             return True
         finally:
             session.close()
@@ -570,9 +570,12 @@ class AppMenuBar(ctk.CTkFrame):  # type: ignore[misc]
             self._on_entry_type_change(selection)
 
     def _show_new_campaign_dialog(self) -> None:
-        if self._campaign_dialog is not None and self._campaign_dialog.winfo_exists():
-            self._campaign_dialog.lift()
-            self._campaign_dialog.focus_force()
+        dialog = self._campaign_dialog
+        if dialog is not None and dialog.winfo_exists():
+            if not dialog.winfo_viewable():
+                dialog.show()
+            dialog.lift()
+            dialog.focus_force()
             return
         self._campaign_dialog = CampaignDialog(
             self._root_win,
@@ -599,12 +602,10 @@ class AppMenuBar(ctk.CTkFrame):  # type: ignore[misc]
             f"Campaign '{name}' created successfully.",
         )
         if self._campaign_dialog is not None:
-            self._campaign_dialog.destroy()
-            self._campaign_dialog = None
+            self._campaign_dialog.hide()
         self._refresh_campaign_options(select=name, notify=True)
 
     def _handle_campaign_dialog_cancel(self) -> None:
-        self._campaign_dialog = None
         self._set_campaign_selection(self._last_campaign_value, notify=False)
 
     def _confirm_delete_current_campaign(self) -> None:
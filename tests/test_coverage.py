@@ -56,6 +56,16 @@ def test_semantic_sorter_orders_keys() -> None:
     assert list(result.keys()) == ["b", "a", "c"]
 
 
+def test_semantic_sorter_keeps_falsy_values() -> None:
+    """SemanticSorter should only drop ordered keys that are missing or None."""
+    sorter = final_project.SemanticSorter(["a", "b", "c"])
+    event = {"b": None, "a": 0, "d": ""}
+    logger_obj = logging.getLogger("semantic-sorter")
+    result = sorter(logger_obj, "info", event)
+    assert result == {"a": 0, "d": ""}
+    assert list(result.keys()) == ["a", "d"]
+
+
 @pytest.mark.parametrize(
     ("argv", "expected"),
     [
@@ -147,7 +157,28 @@ def test_consts_version_uses_metadata(monkeypatch: pytest.MonkeyPatch) -> None:
         return f"{name}-1.0"
 
     monkeypatch.setattr(consts.importlib.metadata, "version", fake_version)
-    assert consts.version() == "final_project-1.0"
+    consts.version.cache_clear()
+    try:
+        assert consts.version() == "final_project-1.0"
+    finally:
+        consts.version.cache_clear()
+
+
+def test_consts_version_is_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    """consts.version should only read the distribution metadata once."""
+    calls: list[str] = []
+
+    def fake_version(name: str) -> str:
+        calls.append(name)
+        return "1.0"
+
+    monkeypatch.setattr(consts.importlib.metadata, "version", fake_version)
+    consts.version.cache_clear()
+    try:
+        assert consts.version() == consts.version() == "1.0"
+    finally:
+        consts.version.cache_clear()
+    assert calls == ["final_project"]
 
 
 def test_consts_main_prints_version(
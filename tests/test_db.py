@@ -10,6 +10,7 @@ import ast
 import builtins
 import importlib
 import io
+import os
 import sys
 import textwrap
 from collections.abc import Callable
@@ -26,6 +27,7 @@ from typing import cast
 import pytest
 from sqlalchemy import Engine
 from sqlalchemy import create_engine
+from sqlalchemy.dialects import mysql
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import sessionmaker
@@ -44,11 +46,20 @@ def _clear_cache(func: Callable[..., object]) -> None:
 @pytest.fixture(autouse=True)
 def clear_caches() -> Iterator[None]:
     """Ensure cached helpers do not leak across tests."""
-    for func in (db._read_config, db._load_sample_data, db._get_session_factory):
+    cached = (
+        db._read_config,
+        db._load_sample_data,
+        db._get_session_factory,
+        db._config_path,
+        db._sample_path,
+    )
+    for func in cached:
         _clear_cache(func)
+    db.clear_faction_caches()
     yield
-    for func in (db._read_config, db._load_sample_data, db._get_session_factory):
+    for func in cached:
         _clear_cache(func)
+    db.clear_faction_caches()
 
 
 @pytest.fixture
@@ -234,7 +245,7 @@ def test_read_config_round_trip(
 ) -> None:
     config_file = tmp_path / "config.toml"
     config_file.write_text("[DB]\ndrivername = 'sqlite'\n", encoding="utf-8")
-    monkeypatch.setattr(db, "CONFIG_PATH", config_file)
+    monkeypatch.setattr(db, "_config_path", lambda: config_file)
     result = db._read_config()
     assert result == {"DB": {"drivername": "sqlite"}}
     # cached value reused even if file changes
@@ -252,15 +263,15 @@ def test_load_sample_data_variants(
     bad_yaml = tmp_path / "bad.yaml"
     bad_yaml.write_text(":: not yaml ::", encoding="utf-8")
 
-    original_safe_load = db.yaml.safe_load
+    original_load = db.yaml.load
 
-    def _raise_yaml_error(_: object) -> None:
+    def _raise_yaml_error(*_: object, **__: object) -> None:
         msg = "boom"
         raise db.yaml.YAMLError(msg)
 
-    monkeypatch.setattr(db.yaml, "safe_load", _raise_yaml_error)
+    monkeypatch.setattr(db.yaml, "load", _raise_yaml_error)
     assert db._load_sample_data(bad_yaml, "bad") == []
-    monkeypatch.setattr(db.yaml, "safe_load", original_safe_load)
+    monkeypatch.setattr(db.yaml, "load", original_load)
 
     empty_yaml = tmp_path / "empty.yaml"
     empty_yaml.write_text("null", encoding="utf-8")
@@ -337,8 +348,10 @@ def test_connector_factory_caches_engine(monkeypatch: pytest.MonkeyPatch) -> Non
             return nullcontext()
 
     dummy_engine = DummyEngine()
+    engine_kwargs: dict[str, Any] = {}
 
-    def fake_create_engine(*_: Any, **__: Any) -> DummyEngine:
+    def fake_create_engine(*_: Any, **kwargs: Any) -> DummyEngine:
+        engine_kwargs.update(kwargs)
         return dummy_engine
 
     monkeypatch.setattr(db, "create_engine", fake_create_engine)
@@ -347,6 +360,7 @@ def test_connector_factory_caches_engine(monkeypatch: pytest.MonkeyPatch) -> Non
     engine_b = factory(LogLevels.INFO)
     assert engine_a is engine_b
     assert dummy_engine.connect_calls == 1
+    assert engine_kwargs["query_cache_size"] == db.QUERY_CACHE_SIZE
 
 
 def test_get_session_factory_reuses_sessionmaker(
@@ -395,6 +409,50 @@ def test_campaign_and_species_helpers(make_session: sessionmaker[Session]) -> No
     session.close()
 
 
+def test_campaign_and_species_helpers_memoize_per_session(
+    make_session: sessionmaker[Session],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = make_session()
+    campaign_data: dict[str, Any] = {
+        "name": "C1",
+        "start_date": "2024-01-02",
+        "status": "active",
+    }
+    species_data: dict[str, Any] = {"name": "Elf", "traits": {}}
+    campaign = db._campaign_from_data(session, campaign_data)
+    species = db._species_from_data(session, species_data)
+
+    def _fail_get(*_: object, **__: object) -> None:
+        msg = "cached lookups should not reach session.get"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(session, "get", _fail_get)
+    assert db._campaign_from_data(session, campaign_data) is campaign
+    assert db._species_from_data(session, species_data) is species
+    session.close()
+
+
+def test_sample_image_bytes_reads_each_path_once(
+    make_session: sessionmaker[Session],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = make_session()
+    reads: list[Path | None] = []
+
+    def fake_read_image(path: Path | None) -> bytes:
+        reads.append(path)
+        return b"img"
+
+    monkeypatch.setattr(db, "_read_image_bytes", fake_read_image)
+    first = db._sample_image_bytes(session, "shared.png")
+    second = db._sample_image_bytes(session, Path("shared.png"))
+    assert first is second
+    assert db._sample_image_bytes(session, " ") is None
+    assert reads == [Path("shared.png")]
+    session.close()
+
+
 def test_location_helper_handles_overrides(
     make_session: sessionmaker[Session],
     monkeypatch: pytest.MonkeyPatch,
@@ -460,6 +518,30 @@ def test_load_all_sample_npcs(
     session.close()
 
 
+def test_load_all_sample_npcs_skips_duplicates_in_batch(
+    make_session: sessionmaker[Session],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = make_session()
+    sample: dict[str, Any] = {
+        "name": "Twin",
+        "alignment_name": "true neutral",
+        "description": "echo",
+        "age": 30,
+        "campaign": {
+            "name": "Sample",
+            "start_date": "2024-01-04",
+            "status": "active",
+        },
+        "species": {"name": "Human", "traits": {}},
+    }
+    monkeypatch.setattr(db, "_load_sample_data", lambda *_: [sample, dict(sample)])
+    monkeypatch.setattr(db, "_read_image_bytes", lambda *_: None)
+    assert db._load_all_sample_npcs(session) == 1
+    assert session.query(db.NPC).filter(db.NPC.name == "Twin").count() == 1
+    session.close()
+
+
 def test_load_all_sample_locations(
     make_session: sessionmaker[Session],
     monkeypatch: pytest.MonkeyPatch,
@@ -677,6 +759,32 @@ def test_get_factions_and_memberships(make_session: sessionmaker[Session]) -> No
     assert db.get_faction_membership(-1) is None
 
 
+def test_faction_lookups_are_cached_until_written(
+    make_session: sessionmaker[Session],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = make_session()
+    data = seed_world(session)
+    session.close()
+
+    assert db.get_faction_details("Wardens") == ("Defense", "Prime")
+    assert db.get_faction_membership(data["npc"].id) == ("Wardens", "Captain")
+
+    def unexpected_session() -> Session:
+        msg = "cached lookups should not open a session"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(db, "get_session", unexpected_session)
+    assert db.get_faction_details("Wardens") == ("Defense", "Prime")
+    assert db.get_faction_membership(data["npc"].id) == ("Wardens", "Captain")
+
+    monkeypatch.setattr(db, "get_session", make_session)
+    db.upsert_faction("Wardens", "Patrol", "Prime")
+    db.assign_faction_member(data["npc"].id, "Wardens", "Lead")
+    assert db.get_faction_details("Wardens") == ("Patrol", "Prime")
+    assert db.get_faction_membership(data["npc"].id) == ("Wardens", "Lead")
+
+
 def test_delete_campaign_paths(
     make_session: sessionmaker[Session],
     monkeypatch: pytest.MonkeyPatch,
@@ -691,23 +799,18 @@ def test_delete_campaign_paths(
 
     error_session = make_session()
     add_campaign(error_session, name="ErrCampaign")
-    rollback_calls = {"count": 0}
-    original_rollback = error_session.rollback
 
-    def failing_commit() -> None:
+    def failing_execute(*_args: Any, **_kwargs: Any) -> None:
         msg = "fail"
         raise SQLAlchemyError(msg)
 
-    def tracking_rollback() -> None:
-        rollback_calls["count"] += 1
-        original_rollback()
-
-    monkeypatch.setattr(error_session, "commit", failing_commit)
-    monkeypatch.setattr(error_session, "rollback", tracking_rollback)
+    monkeypatch.setattr(error_session, "execute", failing_execute)
     monkeypatch.setattr(db, "get_session", lambda: error_session)
     with pytest.raises(RuntimeError, match="Unable to delete the campaign"):
         db.delete_campaign("ErrCampaign")
-    assert rollback_calls["count"] == 1
+    verify_error = make_session()
+    assert verify_error.get(db.Campaign, "ErrCampaign") is not None
+    verify_error.close()
 
     success_session = make_session()
     add_campaign(success_session, name="Gone")
@@ -738,25 +841,18 @@ def test_create_campaign_paths(
         db.create_campaign("Prime", date(2024, 1, 1), "ACTIVE")
 
     error_session = make_session()
-    rollback_calls = {
-        "count": 0,
-    }
-    original_rollback = error_session.rollback
 
-    def failing_commit() -> None:
+    def failing_flush(*_args: Any, **_kwargs: Any) -> None:
         msg = "create fail"
         raise SQLAlchemyError(msg)
 
-    def tracking_rollback() -> None:
-        rollback_calls["count"] += 1
-        original_rollback()
-
-    monkeypatch.setattr(error_session, "commit", failing_commit)
-    monkeypatch.setattr(error_session, "rollback", tracking_rollback)
+    monkeypatch.setattr(error_session, "flush", failing_flush)
     monkeypatch.setattr(db, "get_session", lambda: error_session)
     with pytest.raises(RuntimeError, match="Unable to create the campaign"):
         db.create_campaign("Error", date(2024, 1, 2), "ACTIVE")
-    assert rollback_calls["count"] == 1
+    verify_error = make_session()
+    assert verify_error.get(db.Campaign, "Error") is None
+    verify_error.close()
 
     success_session = make_session()
     monkeypatch.setattr(db, "get_session", lambda: success_session)
@@ -794,23 +890,17 @@ def test_upsert_faction_handles_errors(
     verify_update.close()
 
     error_session = make_session()
-    rollback_calls = {"count": 0}
-    original_rollback = error_session.rollback
 
-    def failing_commit() -> None:
+    def failing_flush(*_args: Any, **_kwargs: Any) -> None:
         msg = "upsert fail"
         raise SQLAlchemyError(msg)
 
-    def tracking_rollback() -> None:
-        rollback_calls["count"] += 1
-        original_rollback()
-
-    monkeypatch.setattr(error_session, "commit", failing_commit)
-    monkeypatch.setattr(error_session, "rollback", tracking_rollback)
+    monkeypatch.setattr(error_session, "flush", failing_flush)
     monkeypatch.setattr(db, "get_session", lambda: error_session)
     with pytest.raises(RuntimeError, match="Unable to save the faction"):
         db.upsert_faction("Guild", "Broken", "Prime")
-    assert rollback_calls["count"] == 1
+    monkeypatch.setattr(db, "get_session", make_session)
+    assert db.get_faction_details("Guild") == ("Merchants", "Prime")
 
 
 def test_assign_and_clear_faction_membership(
@@ -846,37 +936,52 @@ def test_assign_and_clear_faction_membership(
     verify_clear.close()
 
     error_session = make_session()
-    rollback_calls = {"assign": 0, "clear": 0}
-    original_assign_rollback = error_session.rollback
 
-    def failing_commit() -> None:
+    def failing_flush(*_args: Any, **_kwargs: Any) -> None:
         msg = "membership fail"
         raise SQLAlchemyError(msg)
 
-    def tracking_assign_rollback() -> None:
-        rollback_calls["assign"] += 1
-        original_assign_rollback()
-
-    monkeypatch.setattr(error_session, "commit", failing_commit)
-    monkeypatch.setattr(error_session, "rollback", tracking_assign_rollback)
+    monkeypatch.setattr(error_session, "flush", failing_flush)
     monkeypatch.setattr(db, "get_session", lambda: error_session)
     with pytest.raises(RuntimeError, match="Unable to update the faction membership"):
         db.assign_faction_member(data["npc"].id, "Wardens", "Lead")
-    assert rollback_calls["assign"] == 1
+    monkeypatch.setattr(db, "get_session", make_session)
+    assert db.get_faction_membership(data["npc"].id) == ("Wardens", "Captain")
 
     clear_error_session = make_session()
-    original_clear_rollback = clear_error_session.rollback
-
-    def tracking_clear_rollback() -> None:
-        rollback_calls["clear"] += 1
-        original_clear_rollback()
-
-    monkeypatch.setattr(clear_error_session, "commit", failing_commit)
-    monkeypatch.setattr(clear_error_session, "rollback", tracking_clear_rollback)
+    monkeypatch.setattr(clear_error_session, "flush", failing_flush)
     monkeypatch.setattr(db, "get_session", lambda: clear_error_session)
     with pytest.raises(RuntimeError, match="Unable to clear the faction membership"):
         db.clear_faction_membership(data["npc"].id)
-    assert rollback_calls["clear"] == 1
+    monkeypatch.setattr(db, "get_session", make_session)
+    assert db.get_faction_membership(data["npc"].id) == ("Wardens", "Captain")
+
+
+@pytest.mark.parametrize("dialect_name", ["sqlite", "generic"])
+def test_assign_faction_member_reassigns_existing_member(
+    make_session: sessionmaker[Session],
+    memory_engine: Engine,
+    monkeypatch: pytest.MonkeyPatch,
+    dialect_name: str,
+) -> None:
+    session = make_session()
+    data = seed_world(session)
+    session.close()
+    # Non-sqlite/mysql dialects take the UPDATE-then-INSERT fallback.
+    monkeypatch.setattr(memory_engine.dialect, "name", dialect_name)
+
+    db.upsert_faction("Guild", "Traders", "Prime")
+    db.assign_faction_member(data["npc"].id, "Guild", "Moved")
+    db.assign_faction_member(data["ally"].id, "Wardens", "Joined")
+
+    assert db.get_faction_membership(data["npc"].id) == ("Guild", "Moved")
+    assert db.get_faction_membership(data["ally"].id) == ("Wardens", "Joined")
+    verify = make_session()
+    assert {
+        (member.npc_id, member.faction_name)
+        for member in verify.query(db.FactionMembers)
+    } == {(data["npc"].id, "Guild"), (data["ally"].id, "Wardens")}
+    verify.close()
 
 
 def test_get_encounter_participants_branches(
@@ -896,7 +1001,7 @@ def test_get_encounter_participants_branches(
         msg = "query fail"
         raise SQLAlchemyError(msg)
 
-    monkeypatch.setattr(error_session, "query", failing_query)
+    monkeypatch.setattr(error_session, "execute", failing_query)
     monkeypatch.setattr(db, "get_session", lambda: error_session)
     assert db.get_encounter_participants(-1) == []
 
@@ -944,23 +1049,19 @@ def test_upsert_encounter_participant_paths(
     verify_update.close()
 
     error_session = make_session()
-    rollback_calls = {"count": 0}
-    original_rollback = error_session.rollback
 
-    def failing_commit() -> None:
+    def failing_flush(*_args: Any, **_kwargs: Any) -> None:
         msg = "participant fail"
         raise SQLAlchemyError(msg)
 
-    def tracking_rollback() -> None:
-        rollback_calls["count"] += 1
-        original_rollback()
-
-    monkeypatch.setattr(error_session, "commit", failing_commit)
-    monkeypatch.setattr(error_session, "rollback", tracking_rollback)
+    monkeypatch.setattr(error_session, "flush", failing_flush)
     monkeypatch.setattr(db, "get_session", lambda: error_session)
     with pytest.raises(RuntimeError, match="Unable to update encounter participants"):
         db.upsert_encounter_participant(data["encounter"].id, data["npc"].id, "Text")
-    assert rollback_calls["count"] == 1
+    monkeypatch.setattr(db, "get_session", make_session)
+    assert (data["npc"].id, data["npc"].name, "Lead") in db.get_encounter_participants(
+        data["encounter"].id,
+    )
 
 
 def test_delete_encounter_participant_paths(
@@ -971,6 +1072,24 @@ def test_delete_encounter_participant_paths(
     data = seed_world(session)
     session.close()
 
+    error_session = make_session()
+
+    def failing_flush(*_args: Any, **_kwargs: Any) -> None:
+        msg = "delete participant"
+        raise SQLAlchemyError(msg)
+
+    monkeypatch.setattr(error_session, "flush", failing_flush)
+    monkeypatch.setattr(db, "get_session", lambda: error_session)
+    with pytest.raises(
+        RuntimeError,
+        match="Unable to remove the encounter participant",
+    ):
+        db.delete_encounter_participant(data["encounter"].id, data["npc"].id)
+    monkeypatch.setattr(db, "get_session", make_session)
+    assert db.get_encounter_participants(data["encounter"].id) == [
+        (data["npc"].id, data["npc"].name, "Lead"),
+    ]
+
     success_session = make_session()
     monkeypatch.setattr(db, "get_session", lambda: success_session)
     db.delete_encounter_participant(data["encounter"].id, data["npc"].id)
@@ -983,29 +1102,6 @@ def test_delete_encounter_participant_paths(
     )
     verify.close()
 
-    error_session = make_session()
-    add_campaign(error_session, name="Temp")
-    rollback_calls = {"count": 0}
-    original_rollback = error_session.rollback
-
-    def failing_commit() -> None:
-        msg = "delete participant"
-        raise SQLAlchemyError(msg)
-
-    def tracking_rollback() -> None:
-        rollback_calls["count"] += 1
-        original_rollback()
-
-    monkeypatch.setattr(error_session, "commit", failing_commit)
-    monkeypatch.setattr(error_session, "rollback", tracking_rollback)
-    monkeypatch.setattr(db, "get_session", lambda: error_session)
-    with pytest.raises(
-        RuntimeError,
-        match="Unable to remove the encounter participant",
-    ):
-        db.delete_encounter_participant(data["encounter"].id, data["ally"].id)
-    assert rollback_calls["count"] == 1
-
 
 def test_relationship_helpers(
     make_session: sessionmaker[Session],
@@ -1025,7 +1121,7 @@ def test_relationship_helpers(
         msg = "relationship query"
         raise SQLAlchemyError(msg)
 
-    monkeypatch.setattr(error_session, "query", failing_query)
+    monkeypatch.setattr(error_session, "execute", failing_query)
     monkeypatch.setattr(db, "get_session", lambda: error_session)
     assert db.get_relationship_rows(-1) == []
 
@@ -1072,23 +1168,19 @@ def test_relationship_helpers(
     verify_update.close()
 
     error_session = make_session()
-    rollback_calls = {"count": 0}
-    original_rollback = error_session.rollback
 
-    def failing_commit() -> None:
+    def failing_flush(*_args: Any, **_kwargs: Any) -> None:
         msg = "relationship save"
         raise SQLAlchemyError(msg)
 
-    def tracking_rollback() -> None:
-        rollback_calls["count"] += 1
-        original_rollback()
-
-    monkeypatch.setattr(error_session, "commit", failing_commit)
-    monkeypatch.setattr(error_session, "rollback", tracking_rollback)
+    monkeypatch.setattr(error_session, "flush", failing_flush)
     monkeypatch.setattr(db, "get_session", lambda: error_session)
     with pytest.raises(RuntimeError, match="Unable to save the relationship"):
         db.save_relationship(data["npc"].id, data["extra"].id, "Allies")
-    assert rollback_calls["count"] == 1
+    monkeypatch.setattr(db, "get_session", make_session)
+    assert db.get_relationship_rows(data["npc"].id) == [
+        (data["ally"].id, data["ally"].name, "Partner"),
+    ]
 
     assert db.is_text_column(db.NPC.description) is True
     assert db.is_text_column(db.NPC.age) is False
@@ -1122,7 +1214,7 @@ def test_delete_relationship_paths(
     )
     verify.close()
 
-    # Create another relationship entry so the failure path exercises commit/rollback.
+    # Create another relationship entry so the failure path has a row to delete.
     reseed_session = make_session()
     reseed_session.add(
         db.Relationship(
@@ -1135,23 +1227,19 @@ def test_delete_relationship_paths(
     reseed_session.close()
 
     error_session = make_session()
-    rollback_calls = {"count": 0}
-    original_rollback = error_session.rollback
 
-    def failing_commit() -> None:
+    def failing_flush(*_args: Any, **_kwargs: Any) -> None:
         msg = "relationship delete"
         raise SQLAlchemyError(msg)
 
-    def tracking_rollback() -> None:
-        rollback_calls["count"] += 1
-        original_rollback()
-
-    monkeypatch.setattr(error_session, "commit", failing_commit)
-    monkeypatch.setattr(error_session, "rollback", tracking_rollback)
+    monkeypatch.setattr(error_session, "flush", failing_flush)
     monkeypatch.setattr(db, "get_session", lambda: error_session)
     with pytest.raises(RuntimeError, match="Unable to delete the relationship"):
         db.delete_relationship(data["ally"].id, data["extra"].id)
-    assert rollback_calls["count"] == 1
+    monkeypatch.setattr(db, "get_session", make_session)
+    assert db.get_relationship_rows(data["ally"].id) == [
+        (data["extra"].id, data["extra"].name, "Friend"),
+    ]
 
 
 def test_get_types_returns_expected() -> None:
@@ -1180,6 +1268,14 @@ def test_setup_database_rebuild(
     session.close()
 
 
+def test_drop_tables_statement_drops_children_first() -> None:
+    statement = db._drop_tables_statement(mysql.dialect())
+    assert statement.startswith("DROP TABLE IF EXISTS ")
+    names = statement.removeprefix("DROP TABLE IF EXISTS ").split(", ")
+    expected = [table.name for table in reversed(db.Base.metadata.sorted_tables)]
+    assert [name.strip("`") for name in names] == expected
+
+
 def test_apply_external_schema_missing_file(tmp_path: Path) -> None:
     missing = tmp_path / "missing.ddl"
     db.apply_external_schema_with_connector(path=missing)
@@ -1191,6 +1287,19 @@ def test_apply_external_schema_empty_file(tmp_path: Path) -> None:
     db.apply_external_schema_with_connector(path=empty)
 
 
+def test_read_ddl_rereads_only_after_changes(tmp_path: Path) -> None:
+    ddl = tmp_path / "schema.ddl"
+    ddl.write_text("CREATE TABLE one();\n", encoding="utf-8")
+    assert db._read_ddl(ddl) == "CREATE TABLE one();"
+    cached_text = db._read_ddl(ddl)
+    assert db._read_ddl(ddl) is cached_text
+
+    ddl.write_text("CREATE TABLE two();", encoding="utf-8")
+    stat = ddl.stat()
+    os.utime(ddl, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert db._read_ddl(ddl) == "CREATE TABLE two();"
+
+
 def test_apply_external_schema_missing_connector(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -1246,8 +1355,8 @@ def test_apply_external_schema_success(  # noqa: C901 - helper classes inline
         def execute(self, sql: str) -> None:
             self.executed.append(sql)
 
-        def fetchsets(self) -> list[tuple[str, list[str]]]:
-            return [("statement", ["ok"])]
+        def nextset(self) -> bool | None:
+            return None
 
     class DummyConnection:
         def __init__(self) -> None:
@@ -1280,6 +1389,66 @@ def test_apply_external_schema_success(  # noqa: C901 - helper classes inline
     assert connection.cursor_calls == 1
 
 
+def test_apply_external_schema_logs_each_statement_when_debugging(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    ddl = tmp_path / "schema.ddl"
+    ddl.write_text("CREATE TABLE one(); CREATE TABLE two();", encoding="utf-8")
+    monkeypatch.setattr(db, "_read_config", lambda: {"DB": {}})
+    monkeypatch.setattr(db, "_get_env_var", lambda name: f"{name.lower()}_value")
+    logged: list[dict[str, Any]] = []
+
+    class DebugLogger:
+        def is_enabled_for(self, _level: int) -> bool:
+            return True
+
+        def debug(self, _event: str, **kwargs: Any) -> None:
+            logged.append(kwargs)
+
+        def info(self, *_args: Any, **_kwargs: Any) -> None:
+            return None
+
+    class MultiStatementCursor:
+        def __init__(self) -> None:
+            self.pending = ["CREATE TABLE two()"]
+            self.statement = "CREATE TABLE one()"
+            self.rowcount = 0
+
+        def __enter__(self) -> Self:
+            return self
+
+        def __exit__(self, *_exc: object) -> None:
+            return None
+
+        def execute(self, _sql: str) -> None:
+            return None
+
+        def nextset(self) -> bool | None:
+            if not self.pending:
+                return None
+            self.statement = self.pending.pop()
+            return True
+
+    cursor = MultiStatementCursor()
+    connection = SimpleNamespace(
+        cursor=lambda: cursor,
+        commit=lambda: None,
+        close=lambda: None,
+    )
+    monkeypatch.setattr(db, "logger", DebugLogger())
+    monkeypatch.setattr(
+        db,
+        "mysql_connector",
+        SimpleNamespace(connect=lambda **_kwargs: connection),
+    )
+    db.apply_external_schema_with_connector(path=ddl)
+    assert logged == [
+        {"statement": "CREATE TABLE one()", "rowcount": 0},
+        {"statement": "CREATE TABLE two()", "rowcount": 0},
+    ]
+
+
 def test_apply_external_schema_drop_database_first(  # noqa: C901 - helper classes inline
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
@@ -1307,8 +1476,8 @@ def test_apply_external_schema_drop_database_first(  # noqa: C901 - helper class
         def execute(self, sql: str) -> None:
             self.executed_sql.append(sql)
 
-        def fetchsets(self) -> list[tuple[str, list[str]]]:
-            return []
+        def nextset(self) -> bool | None:
+            return None
 
     class RecordingConnection:
         def __init__(self) -> None:
@@ -1370,8 +1539,8 @@ def test_apply_external_schema_cursor_failure(  # noqa: C901 - helper classes in
             msg = "cursor fail"
             raise RuntimeError(msg)
 
-        def fetchsets(self) -> list[tuple[str, list[str]]]:
-            return []
+        def nextset(self) -> bool | None:
+            return None
 
     class ExplodingConnection:
         def __init__(self) -> None:
@@ -1431,6 +1600,13 @@ def test_export_database_ddl_handles_empty_schema(
     assert buffer.getvalue() == "-- No tables defined.\n"
 
 
+def test_table_ddl_is_compiled_once_per_dialect(memory_engine: Engine) -> None:
+    table = db.Base.metadata.tables["faction"]
+    first = db._table_ddl(table, memory_engine.dialect)
+    assert first[0].lstrip().startswith("CREATE TABLE faction")
+    assert db._table_ddl(table, memory_engine.dialect) is first
+
+
 def test_cli_prints_help(monkeypatch: pytest.MonkeyPatch) -> None:
     calls = {"count": 0}
 
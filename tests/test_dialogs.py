@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import importlib
 import tkinter as tk
+from collections.abc import Callable
 from collections.abc import Iterator
 from collections.abc import Sequence
 from copy import deepcopy
+from datetime import UTC
+from datetime import datetime
 from typing import cast
 
 import customtkinter as ctk
@@ -60,6 +64,18 @@ def test_settings_dialog_convert_value_handles_various_types(
     assert settings_dialog._convert_value("", None) is None
 
 
+def test_settings_dialog_parse_literal_round_trips_json(
+    settings_dialog: dialogs.SettingsDialog,
+) -> None:
+    value = {"names": ["Aelin", "Nyx"], "enabled": True, "limit": None}
+    raw_value = settings_dialog._stringify_value(value)
+    assert settings_dialog._convert_value(raw_value, {}) == value
+    assert settings_dialog._convert_value("null", None) is None
+    assert settings_dialog._convert_value("(1, 2)", [0]) == (1, 2)
+    with pytest.raises(ValueError, match="valid Python literal"):
+        settings_dialog._convert_value("[1,", [0])
+
+
 def test_settings_dialog_convert_value_rejects_bad_boolean(
     settings_dialog: dialogs.SettingsDialog,
 ) -> None:
@@ -68,6 +84,20 @@ def test_settings_dialog_convert_value_rejects_bad_boolean(
         settings_dialog._convert_value("maybe", bad_original)
 
 
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [(" YES ", True), ("On", True), ("1", True), ("FALSE", False), ("off", False)],
+)
+def test_settings_dialog_convert_value_accepts_boolean_words(
+    settings_dialog: dialogs.SettingsDialog,
+    text: str,
+    *,
+    expected: bool,
+) -> None:
+    original_bool = True
+    assert settings_dialog._convert_value(text, original_bool) is expected
+
+
 def test_settings_dialog_handle_save_updates_settings(
     tk_app: ctk.CTk,
     monkeypatch: pytest.MonkeyPatch,
@@ -89,11 +119,11 @@ def test_settings_dialog_handle_save_updates_settings(
         "save_settings",
         lambda payload: saved_payloads.append(payload) or payload,
     )
-    infos: list[tuple[str, str]] = []
+    toasts: list[str] = []
     monkeypatch.setattr(
-        dialogs.messagebox,
-        "showinfo",
-        lambda *args: infos.append(args),
+        dialogs,
+        "_show_toast",
+        lambda _parent, message: toasts.append(message) or "after#toast",
     )
     monkeypatch.setattr(
         dialogs.messagebox,
@@ -103,7 +133,7 @@ def test_settings_dialog_handle_save_updates_settings(
     callbacks: list[dict[str, dict[str, int | str]]] = []
     dialog = dialogs.SettingsDialog(tk_app, on_settings_saved=callbacks.append)
     dialog.withdraw()
-    entry, _original = dialog._fields[("ui", "refresh_seconds")]
+    entry = dialog._fields[("ui", "refresh_seconds")].entry
     entry.delete(0, tk.END)
     entry.insert(0, str(new_refresh_value))
 
@@ -113,8 +143,34 @@ def test_settings_dialog_handle_save_updates_settings(
     assert saved_payloads[0]["ui"]["refresh_seconds"] == new_refresh_value
     assert callbacks
     assert callbacks[0] is saved_payloads[0]
-    assert infos
-    assert infos[-1] == ("Settings", "Settings saved successfully.")
+    assert toasts == ["Settings saved successfully."]
+
+
+def test_settings_dialog_defers_rows_beyond_first_screen(
+    tk_app: ctk.CTk,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    total = dialogs.EAGER_SETTING_ROWS + 3
+    snapshot = {"ui": {f"option_{index:02d}": index for index in range(total)}}
+    monkeypatch.setattr(
+        dialogs.settings_manager,
+        "get_settings_snapshot",
+        lambda: deepcopy(snapshot),
+    )
+    dialog = dialogs.SettingsDialog(tk_app)
+    dialog.withdraw()
+    try:
+        assert len(dialog._fields) == dialogs.EAGER_SETTING_ROWS
+        assert dialog._pending_after_id is not None
+
+        dialog._build_pending_rows()
+
+        assert len(dialog._fields) == total
+        assert dialog._pending_after_id is None
+        last_field = dialog._fields[("ui", f"option_{total - 1:02d}")]
+        assert last_field.entry.get() == str(total - 1)
+    finally:
+        dialog._handle_cancel()
 
 
 def test_settings_dialog_handle_save_reports_save_error(
@@ -133,20 +189,20 @@ def test_settings_dialog_handle_save_reports_save_error(
         lambda _payload: (_ for _ in ()).throw(OSError("disk full")),
     )
     errors: list[tuple[str, str]] = []
-    infos: list[tuple[str, str]] = []
+    toasts: list[str] = []
     monkeypatch.setattr(
         dialogs.messagebox,
         "showerror",
         lambda *args: errors.append(args),
     )
     monkeypatch.setattr(
-        dialogs.messagebox,
-        "showinfo",
-        lambda *args: infos.append(args),
+        dialogs,
+        "_show_toast",
+        lambda _parent, message: toasts.append(message) or "after#toast",
     )
     dialog = dialogs.SettingsDialog(tk_app)
     dialog.withdraw()
-    entry, _original = dialog._fields[("ui", "refresh_seconds")]
+    entry = dialog._fields[("ui", "refresh_seconds")].entry
     entry.delete(0, tk.END)
     entry.insert(0, "10")
 
@@ -155,7 +211,7 @@ def test_settings_dialog_handle_save_reports_save_error(
     try:
         assert errors
         assert "Unable to save settings" in errors[-1][1]
-        assert not infos
+        assert not toasts
         assert dialog.winfo_exists()
     finally:
         if dialog.winfo_exists():
@@ -177,23 +233,28 @@ def test_settings_dialog_handle_save_validation_error_shows_message(
         "save_settings",
         lambda _payload: (_ for _ in ()).throw(AssertionError("should not save")),
     )
-    errors: list[tuple[str, str]] = []
     monkeypatch.setattr(
         dialogs.messagebox,
         "showerror",
-        lambda *args: errors.append(args),
+        lambda *args: (_ for _ in ()).throw(AssertionError("unexpected showerror")),
     )
-    monkeypatch.setattr(dialogs.messagebox, "showinfo", lambda *args, **kwargs: None)
+    monkeypatch.setattr(dialogs, "_show_toast", lambda *_args: "after#toast")
     dialog = dialogs.SettingsDialog(tk_app)
     dialog.withdraw()
-    entry, _original = dialog._fields[("ui", "refresh_seconds")]
+    entry = dialog._fields[("ui", "refresh_seconds")].entry
+    default_border = entry.cget("border_color")
     entry.delete(0, tk.END)
 
     dialog._handle_save()
 
     try:
-        assert errors
-        assert "enter an integer value" in errors[0][1]
+        message = dialog._errors._status_label.cget("text")
+        assert message.startswith("ui / Refresh seconds: ")
+        assert "enter an integer value" in message
+        assert entry.cget("border_color") == dialogs.ERROR_COLOR
+        dialog._errors.clear()
+        assert entry.cget("border_color") == default_border
+        assert not dialog._errors._status_label.cget("text")
     finally:
         if dialog.winfo_exists():
             dialog._handle_cancel()
@@ -215,12 +276,11 @@ def test_settings_dialog_handle_reset_defaults_overwrites_fields(
         "reset_user_settings_to_defaults",
         lambda: deepcopy(new_snapshot),
     )
-    monkeypatch.setattr(dialogs.messagebox, "askyesno", lambda *args, **kwargs: True)
-    infos: list[tuple[str, str]] = []
+    toasts: list[str] = []
     monkeypatch.setattr(
-        dialogs.messagebox,
-        "showinfo",
-        lambda *args: infos.append(args),
+        dialogs,
+        "_show_toast",
+        lambda _parent, message: toasts.append(message) or "after#toast",
     )
     dialog = dialogs.SettingsDialog(tk_app)
     dialog.withdraw()
@@ -228,13 +288,17 @@ def test_settings_dialog_handle_reset_defaults_overwrites_fields(
     dialog._handle_reset_defaults()
 
     try:
-        for key, (_entry, original) in dialog._fields.items():
-            group, setting = key
-            assert original == new_snapshot[group][setting]
-        entry, _original = dialog._fields[("ui", "theme")]
-        assert entry.get() == "light"
-        assert infos
-        assert infos[-1][1] == "Settings reset to defaults."
+        assert dialog._fields[("ui", "theme")].variable.get() == "dark"
+        assert dialog._confirm_frame is not None
+        assert dialog._confirm_frame.place_info()
+        dialog._confirm_yes_button.invoke()
+        assert not dialog._confirm_frame.place_info()
+        for (group, setting), field in dialog._fields.items():
+            assert field.original == new_snapshot[group][setting]
+        theme_field = dialog._fields[("ui", "theme")]
+        assert theme_field.variable.get() == "light"
+        assert theme_field.entry.get() == "light"
+        assert toasts == ["Settings reset to defaults."]
     finally:
         if dialog.winfo_exists():
             dialog._handle_cancel()
@@ -255,33 +319,129 @@ def test_settings_dialog_reset_defaults_failure_shows_error(
         "reset_user_settings_to_defaults",
         lambda: (_ for _ in ()).throw(OSError("nope")),
     )
-    monkeypatch.setattr(dialogs.messagebox, "askyesno", lambda *args, **kwargs: True)
     errors: list[tuple[str, str]] = []
-    infos: list[tuple[str, str]] = []
+    toasts: list[str] = []
     monkeypatch.setattr(
         dialogs.messagebox,
         "showerror",
         lambda *args: errors.append(args),
     )
     monkeypatch.setattr(
-        dialogs.messagebox,
-        "showinfo",
-        lambda *args: infos.append(args),
+        dialogs,
+        "_show_toast",
+        lambda _parent, message: toasts.append(message) or "after#toast",
     )
     dialog = dialogs.SettingsDialog(tk_app)
     dialog.withdraw()
 
     dialog._handle_reset_defaults()
+    dialog._confirm_yes_button.invoke()
 
     try:
         assert errors
         assert "Unable to reset settings" in errors[-1][1]
-        assert not infos
+        assert not toasts
     finally:
         if dialog.winfo_exists():
             dialog._handle_cancel()
 
 
+def test_settings_dialog_reset_defaults_declined_keeps_fields(
+    tk_app: ctk.CTk,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        dialogs.settings_manager,
+        "get_settings_snapshot",
+        lambda: {"ui": {"theme": "dark"}},
+    )
+    monkeypatch.setattr(
+        dialogs.settings_manager,
+        "reset_user_settings_to_defaults",
+        lambda: (_ for _ in ()).throw(AssertionError("should not reset")),
+    )
+    dialog = dialogs.SettingsDialog(tk_app)
+    dialog.withdraw()
+
+    dialog._handle_reset_defaults()
+    dialog._dismiss_confirm()
+
+    try:
+        assert dialog._confirm_frame is not None
+        assert not dialog._confirm_frame.place_info()
+        assert dialog._fields[("ui", "theme")].variable.get() == "dark"
+    finally:
+        dialog._handle_cancel()
+
+
+def test_settings_dialog_show_reuses_hidden_form(
+    tk_app: ctk.CTk,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    snapshot: dict[str, dict[str, object]] = {"ui": {"theme": "dark"}}
+    monkeypatch.setattr(
+        dialogs.settings_manager,
+        "get_settings_snapshot",
+        lambda: deepcopy(snapshot),
+    )
+    dialog = dialogs.SettingsDialog(tk_app)
+    dialog.withdraw()
+    theme_field = dialog._fields[("ui", "theme")]
+    theme_field.variable.set("unsaved")
+
+    dialog._handle_cancel()
+    assert dialog.winfo_exists()
+    dialog.show()
+
+    assert dialog._fields[("ui", "theme")] is theme_field
+    assert theme_field.entry.get() == "dark"
+
+    snapshot["ui"]["refresh_seconds"] = 5
+    dialog._handle_cancel()
+    dialog.show()
+
+    try:
+        assert set(dialog._fields) == {("ui", "theme"), ("ui", "refresh_seconds")}
+        assert dialog._fields[("ui", "theme")] is not theme_field
+    finally:
+        dialog.destroy()
+
+
+def test_faction_dialog_show_resets_reused_dialog(tk_app: ctk.CTk) -> None:
+    submitted: list[tuple[str, str, str]] = []
+    dialog = dialogs.FactionDialog(
+        cast("dialogs.DialogManager", tk_app),
+        "Harpers",
+        "Sword Coast",
+        lambda *args: submitted.append(args),
+        dialog_title="Edit Faction",
+        allow_name_edit=False,
+        initial_notes="Old note",
+    )
+    dialog._handle_submit()
+    assert dialog.winfo_exists()
+    assert submitted == [("Harpers", "", "Old note")]
+
+    resubmitted: list[tuple[str, str, str]] = []
+    dialog.show("Zhentarim", "Moonsea", lambda *args: resubmitted.append(args))
+
+    try:
+        assert dialog.title() == "New Faction"
+        assert dialog._name_entry.cget("state") == "normal"
+        assert dialog._notes.get("1.0", tk.END).strip() == ""
+        dialog._handle_submit()
+        assert resubmitted == [("Zhentarim", "", "")]
+        assert len(submitted) == 1
+    finally:
+        dialog.destroy()
+
+
+def test_build_trash_icon_is_shared_between_dialogs() -> None:
+    icon = dialogs._build_trash_icon(16)
+    assert dialogs._build_trash_icon(16) is icon
+    assert icon.cget("size") == (16, 16)
+
+
 def test_build_relationship_row_specs_handles_none_rows() -> None:
     assert dialogs.build_relationship_row_specs(None) == ()
     first_target_id = 10
@@ -400,7 +560,12 @@ def test_relationship_dialog_reload_rows_uses_specs(
     source_id = 77
     dialog.source_id = source_id
     dialog._rows_frame = ctk.CTkScrollableFrame(tk_app)
-    dialog._delete_icon = cast(ctk.CTkImage, None)
+    dialog._row_list = dialogs._RecycledRows(
+        dialog._rows_frame,
+        empty_text="No relationships recorded.",
+        icon=cast(ctk.CTkImage, None),
+        on_delete=lambda _target_id: None,
+    )
     sentinel = dialogs.RelationshipRowSpec(
         target_id=88,
         target_name="Quill",
@@ -429,6 +594,39 @@ def test_relationship_dialog_reload_rows_uses_specs(
         dialog._rows_frame.destroy()
 
 
+def test_recycled_rows_diff_by_key(tk_app: ctk.CTk) -> None:
+    parent = ctk.CTkScrollableFrame(tk_app)
+    deleted: list[int] = []
+    row_list = dialogs._RecycledRows(
+        parent,
+        empty_text="Nothing here.",
+        icon=cast(ctk.CTkImage, None),
+        on_delete=deleted.append,
+    )
+    try:
+        row_list.render([(1, "Aelin", "Mentor"), (2, "Nyx", "Rival")])
+        aelin_frame = row_list._rows[1].frame
+        nyx_frame = row_list._rows[2].frame
+
+        row_list.render([(2, "Nyx", "Ally")])
+        assert row_list._rows[2].frame is nyx_frame
+        assert row_list._rows[2].detail_label.cget("text") == "Ally"
+        assert not aelin_frame.winfo_manager()
+
+        row_list.render([(3, "Brann", ""), (2, "Nyx", "Ally")])
+        assert row_list._rows[3].frame is aelin_frame
+        assert parent.pack_slaves() == [aelin_frame, nyx_frame]
+        row_list._rows[3].delete_button.invoke()
+        assert deleted == [3]
+
+        row_list.render([])
+        assert parent.pack_slaves() == [row_list._empty_label]
+        assert row_list._empty_label is not None
+        assert row_list._empty_label.cget("text") == "Nothing here."
+    finally:
+        parent.destroy()
+
+
 class EncounterManagerStub:
     def __init__(
         self,
@@ -505,7 +703,12 @@ def test_encounter_dialog_reload_rows_uses_specs(
     encounter_id = 42
     dialog.encounter_id = encounter_id
     dialog._rows_frame = ctk.CTkScrollableFrame(tk_app)
-    dialog._delete_icon = cast(ctk.CTkImage, None)
+    dialog._row_list = dialogs._RecycledRows(
+        dialog._rows_frame,
+        empty_text="No participants assigned to this encounter.",
+        icon=cast(ctk.CTkImage, None),
+        on_delete=lambda _npc_id: None,
+    )
     dialog._current_members = set()
     sentinel = dialogs.EncounterMemberSpec(
         npc_id=91,
@@ -539,9 +742,11 @@ def test_encounter_dialog_reload_rows_uses_specs(
 class ComboStub:
     def __init__(self, value: str = "") -> None:
         self.configured_values: tuple[str, ...] = ()
+        self.configure_calls = 0
         self.selected_value = value
 
     def configure(self, *, values: Sequence[str]) -> None:  # type: ignore[override]
+        self.configure_calls += 1
         self.configured_values = tuple(values)
 
     def set(self, value: str) -> None:
@@ -565,6 +770,8 @@ def test_relationship_dialog_refresh_target_options_uses_combo_helper(
     dialog.source_id = 70
     dialog.campaign = "alpha"
     dialog._target_option_map = {}
+    dialog._target_options = dialogs._NpcOptionsCache()
+    dialog._target_values = ()
     selected_label = dialogs.format_npc_option_label(targets[1])
     combo_stub = ComboStub(selected_label)
     dialog._target_combo = cast(ctk.CTkComboBox, combo_stub)
@@ -590,10 +797,11 @@ def test_relationship_dialog_refresh_target_options_uses_combo_helper(
     assert captured["current"] == selected_label
     assert combo_stub.configured_values == combo_state.values
     assert combo_stub.selected_value == combo_state.selected
-    assert manager.last_target_request == {
-        "campaign": "alpha",
-        "exclude": (dialog.source_id,),
-    }
+    assert manager.last_target_request == {"campaign": "alpha", "exclude": ()}
+
+    dialog._refresh_target_options()
+
+    assert combo_stub.configure_calls == 1
 
 
 def test_encounter_dialog_refresh_npc_options_uses_combo_helper(
@@ -610,6 +818,8 @@ def test_encounter_dialog_refresh_npc_options_uses_combo_helper(
     existing_member_id = targets[0].identifier
     dialog._current_members = {existing_member_id}
     dialog._npc_option_map = {}
+    dialog._npc_options = dialogs._NpcOptionsCache()
+    dialog._npc_values = ()
     selected_label = dialogs.format_npc_option_label(targets[0])
     combo_stub = ComboStub(selected_label)
     dialog._npc_combo = cast(ctk.CTkComboBox, combo_stub)
@@ -628,17 +838,175 @@ def test_encounter_dialog_refresh_npc_options_uses_combo_helper(
 
     dialog._refresh_npc_options()
 
-    expected_options = tuple(
-        dialogs.format_npc_option_label(option) for option in manager.targets
-    )
-    assert captured["options"] == expected_options
+    assert captured["options"] == (dialogs.format_npc_option_label(targets[1]),)
     assert captured["current"] == selected_label
     assert combo_stub.configured_values == combo_state.values
     assert combo_stub.selected_value == combo_state.selected
-    assert manager.last_target_request == {
-        "campaign": "beta",
-        "exclude": (existing_member_id,),
-    }
+    assert manager.last_target_request == {"campaign": "beta", "exclude": ()}
+
+    dialog._refresh_npc_options()
+
+    assert combo_stub.configure_calls == 1
+
+
+def test_npc_options_cache_reuses_campaign_fetch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    targets = (
+        dialogs.NpcOption(identifier=1, name="Aelin"),
+        dialogs.NpcOption(identifier=2, name="Nyx"),
+    )
+    requests: list[str | None] = []
+
+    class CountingManager(RelationshipManagerStub):
+        def relationship_targets_for_campaign(
+            self,
+            campaign: str | None,
+            *,
+            exclude: Sequence[int] | None = None,
+        ) -> list[dialogs.NpcOption]:
+            requests.append(campaign)
+            return super().relationship_targets_for_campaign(
+                campaign,
+                exclude=exclude,
+            )
+
+    manager = cast(dialogs.DialogManager, CountingManager(targets=targets))
+    clock = {"now": 100.0}
+    monkeypatch.setattr(dialogs.time, "monotonic", lambda: clock["now"])
+    cache = dialogs._NpcOptionsCache()
+
+    labels = [dialogs.format_npc_option_label(target) for target in targets]
+    assert cache.labelled(manager, "alpha", {1}) == [(labels[1], 2)]
+    assert cache.labelled(manager, "alpha", {2}) == [(labels[0], 1)]
+    assert requests == ["alpha"]
+
+    cache.labelled(manager, "beta", set())
+    cache.invalidate()
+    cache.labelled(manager, "beta", set())
+    clock["now"] += dialogs.TARGET_OPTIONS_TTL_SECONDS
+    cache.labelled(manager, "beta", set())
+    assert requests == ["alpha", "beta", "beta", "beta"]
+
+
+class LabelStub:
+    def __init__(self) -> None:
+        self.text = ""
+
+    def configure(self, *, text: str) -> None:
+        self.text = text
+
+
+class BorderedWidgetStub:
+    def __init__(self) -> None:
+        self.border_color: object = "gray50"
+        self.bindings: list[tuple[str, Callable[[object], None]]] = []
+        self.focused = False
+
+    def cget(self, option: str) -> object:
+        assert option == "border_color"
+        return self.border_color
+
+    def configure(self, *, border_color: object) -> None:
+        self.border_color = border_color
+
+    def bind(
+        self,
+        sequence: str,
+        command: Callable[[object], None],
+        add: str | bool = True,
+    ) -> None:
+        assert add
+        self.bindings.append((sequence, command))
+
+    def focus_set(self) -> None:
+        self.focused = True
+
+
+def test_inline_errors_flag_one_widget_at_a_time() -> None:
+    label = LabelStub()
+    errors = dialogs._InlineErrors(cast(ctk.CTkLabel, label))
+    name_entry = BorderedWidgetStub()
+    type_entry = BorderedWidgetStub()
+
+    errors.show(cast(ctk.CTkEntry, name_entry), "Enter a name.")
+    errors.show(cast(ctk.CTkEntry, name_entry), "Enter a name.")
+
+    assert label.text == "Enter a name."
+    assert name_entry.border_color == dialogs.ERROR_COLOR
+    assert name_entry.focused
+    assert [sequence for sequence, _ in name_entry.bindings] == ["<FocusOut>"]
+
+    errors.show(cast(ctk.CTkEntry, type_entry), "Enter a type.")
+
+    assert name_entry.border_color == "gray50"
+    assert type_entry.border_color == dialogs.ERROR_COLOR
+    _, on_focus_out = type_entry.bindings[0]
+    on_focus_out(object())
+    assert type_entry.border_color == "gray50"
+    assert label.text == "Enter a type."
+    errors.clear()
+    assert not label.text
+
+
+class RowListStub:
+    def __init__(self) -> None:
+        self.rendered: list[list[tuple[int, str, str]]] = []
+
+    def render(self, entries: Sequence[tuple[int, str, str]]) -> None:
+        self.rendered.append(list(entries))
+
+
+class AfterStub:
+    def __init__(self) -> None:
+        self.scheduled: dict[str, Callable[[], None]] = {}
+        self.cancelled: list[str] = []
+
+    def after(self, _delay_ms: int, callback: Callable[[], None]) -> str:
+        after_id = f"after#{len(self.scheduled) + len(self.cancelled)}"
+        self.scheduled[after_id] = callback
+        return after_id
+
+    def after_cancel(self, after_id: str) -> None:
+        self.cancelled.append(after_id)
+        self.scheduled.pop(after_id, None)
+
+    def run_pending(self) -> None:
+        for callback in list(self.scheduled.values()):
+            callback()
+
+
+def test_relationship_dialog_coalesces_context_updates(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    dialog = dialogs.RelationshipDialog.__new__(dialogs.RelationshipDialog)
+    manager = RelationshipManagerStub()
+    dialog.manager = cast(dialogs.DialogManager, manager)
+    dialog._target_option_map = {}
+    dialog._target_options = dialogs._NpcOptionsCache()
+    dialog._target_values = ()
+    dialog._target_combo = cast(ctk.CTkComboBox, ComboStub())
+    header = LabelStub()
+    dialog._header_label = cast(ctk.CTkLabel, header)
+    row_list = RowListStub()
+    dialog._row_list = cast(dialogs._RecycledRows, row_list)
+    dialog._refresh_after_id = None
+    scheduler = AfterStub()
+    monkeypatch.setattr(dialog, "after", scheduler.after)
+    monkeypatch.setattr(dialog, "after_cancel", scheduler.after_cancel)
+    monkeypatch.setattr(dialog, "winfo_exists", lambda: True)
+
+    for source_id in (1, 2, 3):
+        dialog.update_context(source_id, f"NPC {source_id}", "alpha")
+
+    assert header.text == "Relationships - NPC 3"
+    assert manager.requested_source_id is None
+    assert len(scheduler.scheduled) == 1
+    scheduler.run_pending()
+    assert manager.requested_source_id == dialog.source_id
+    assert row_list.rendered == [[(999, "ignored", "ignored")]]
+    assert manager.last_target_request == {"campaign": "alpha", "exclude": ()}
+    assert dialog._refresh_after_id is None
 
 
 def test_campaign_dialog_configure_status_combo_uses_helper(
@@ -668,6 +1036,117 @@ def test_campaign_dialog_configure_status_combo_uses_helper(
     assert combo_stub.selected_value == combo_state.selected
 
 
+def _campaign_dialog_with_inputs(
+    name: str,
+    start_date: str,
+    status: str,
+) -> tuple[CampaignDialog, list[tuple[str, str, str]]]:
+    dialog = CampaignDialog.__new__(CampaignDialog)
+    dialog._name_entry = cast(ctk.CTkEntry, ComboStub(name))
+    dialog._date_entry = cast(ctk.CTkEntry, ComboStub(start_date))
+    dialog._status_combo = cast(ctk.CTkComboBox, ComboStub(status))
+    dialog._error_label = cast(ctk.CTkLabel, LabelStub())
+    submitted: list[tuple[str, str, str]] = []
+    dialog._on_submit = lambda *args: submitted.append(args)
+    return dialog, submitted
+
+
+@pytest.mark.parametrize("start_date", ["2024-02-30", "2024-2-01", "20240201"])
+def test_campaign_dialog_rejects_malformed_start_date(start_date: str) -> None:
+    dialog, submitted = _campaign_dialog_with_inputs("Saltmarsh", start_date, "ACTIVE")
+
+    dialog._handle_submit()
+
+    error_label = cast(LabelStub, dialog._error_label)
+    assert error_label.text == "Enter the start date as YYYY-MM-DD."
+    assert not submitted
+
+
+def test_campaign_dialog_reports_all_missing_fields_at_once() -> None:
+    dialog, submitted = _campaign_dialog_with_inputs(" ", "", "")
+
+    dialog._handle_submit()
+
+    error_label = cast(LabelStub, dialog._error_label)
+    assert error_label.text == (
+        "Enter a campaign name.\nEnter a start date.\nSelect a campaign status."
+    )
+    assert not submitted
+
+
+def test_campaign_dialog_submits_valid_campaign() -> None:
+    dialog, submitted = _campaign_dialog_with_inputs(
+        " Saltmarsh ",
+        "2024-02-29",
+        "ACTIVE",
+    )
+    error_label = cast(LabelStub, dialog._error_label)
+    error_label.text = "Enter a campaign name."
+
+    dialog._handle_submit()
+
+    assert submitted == [("Saltmarsh", "2024-02-29", "ACTIVE")]
+    assert not error_label.text
+
+
+def test_campaign_dialog_show_resets_hidden_form(tk_app: ctk.CTk) -> None:
+    cancelled: list[bool] = []
+    dialog = CampaignDialog(
+        tk_app,
+        on_submit=lambda *_args: None,
+        on_cancel=lambda: cancelled.append(True),
+    )
+    dialog._name_entry.insert(0, "Saltmarsh")
+    dialog._date_entry.delete(0, tk.END)
+    dialog._status_combo.set("COMPLETED")
+
+    dialog._handle_cancel()
+    assert cancelled == [True]
+    assert dialog.winfo_exists()
+    dialog.show()
+
+    try:
+        assert dialog._name_entry.get() == ""
+        assert dialog._date_entry.get() == datetime.now(UTC).date().isoformat()
+        assert dialog._status_combo.get() == "ACTIVE"
+    finally:
+        dialog.destroy()
+
+
+def test_build_button_row_wires_commands(tk_app: ctk.CTk) -> None:
+    clicks: list[str] = []
+    row, submit_button = dialogs.build_button_row(
+        tk_app,
+        on_cancel=lambda: clicks.append("cancel"),
+        on_submit=lambda: clicks.append("submit"),
+        submit_text="Create",
+    )
+    try:
+        cancel_button = next(
+            child
+            for child in row.winfo_children()
+            if isinstance(child, ctk.CTkButton) and child is not submit_button
+        )
+        assert submit_button.cget("text") == "Create"
+        submit_button.invoke()
+        cancel_button.invoke()
+        assert clicks == ["submit", "cancel"]
+    finally:
+        row.destroy()
+
+
+def test_campaign_dialog_today_iso_is_cached_per_utc_day() -> None:
+    module = importlib.import_module(CampaignDialog.__module__)
+    today = module._today_iso()
+    assert today == datetime.now(UTC).date().isoformat()
+
+    module._TODAY.text = "cached"
+    assert module._today_iso() == "cached"
+
+    module._TODAY.day -= 1
+    assert module._today_iso() == today
+
+
 def test_build_settings_group_specs_formats_and_sorts() -> None:
     snapshot = {
         "zeta_options": {"beta_flag": True, "alpha_value": 5},
@@ -715,9 +1194,10 @@ def test_settings_dialog_build_widgets_uses_group_specs(
         assert captured_snapshot == sample_snapshot
         field_key = (sentinel_group.key, sentinel_field.key)
         assert field_key in dialog._fields
-        entry, original = dialog._fields[field_key]
-        assert original == sentinel_field.original_value
-        assert entry.get() == "7"
+        field = dialog._fields[field_key]
+        assert field.original == sentinel_field.original_value
+        assert field.entry.get() == "7"
+        assert field.label == "Combat Rules / HP Limit"
         section_frames = dialog._scroll_frame.winfo_children()
         assert section_frames, "expected at least one section frame"
         group_label = section_frames[0].winfo_children()[0]